@@ -25,7 +25,8 @@ class PreyAgent(Agent):
         self.unique_id = unique_id
         self.prey_type = prey_type
         self.color = color
-        self.odor = odor
+        # Converted once so every deposit adds a ready-made float32 vector
+        self.odor = np.asarray(odor, dtype=np.float32)
         self.angle = self.random.uniform(0, 360)
         self.radius = model.prey_radius
         self.heading = self.random.uniform(0, 360)
@@ -39,8 +40,9 @@ class PreyAgent(Agent):
         """Move and deposit odor"""
         x, y = self.pos
 
-        # Deposit odor at current location
-        self.model.set_patch_odor(x, y, self.odor)
+        # Deposit odor at current location (batched by the model into the
+        # next tick's scatter-add)
+        self.model.queue_patch_odor(x, y, self.odor)
 
         # Move with clustering behavior if enabled
         if self.model.clustering and self.cluster_target:
@@ -67,10 +69,10 @@ class PreyAgent(Agent):
         # Calculate distance to cluster
         dx = cx - x
         dy = cy - y
-        dist = math.sqrt(dx**2 + dy**2)
+        radius = self.model.cluster_radius
 
         # If outside cluster radius, move towards center
-        if dist > self.model.cluster_radius:
+        if dx * dx + dy * dy > radius * radius:
             angle_to_cluster = math.degrees(math.atan2(dy, dx))
             # Gradually turn towards cluster
             angle_diff = (angle_to_cluster - self.angle + 180) % 360 - 180
@@ -101,16 +103,119 @@ class PreyAgent(Agent):
         self.model.space.move_agent(self, (new_x, new_y))
 
 
+# Nociceptor layout (NetLogo style): angle offset from heading in degrees
+# (negative = right side) and distance from the center as a fraction of size
+_NOC_IDS = ("snsrOL", "snsrOR", "snsrUL", "snsrUR", "snsrBL", "snsrBR", "snsrBM")
+_NOC_ANGLES = np.radians([40, -40, 100, -100, 150, -150, 180])
+_NOC_DISTS = np.array([0.4, 0.4, 0.3, 0.3, 0.35, 0.35, 0.46])
+
+# Odor sensors, left/right alternating: oral veil, upper body and back, in
+# degrees from heading and fractions of size
+_SENSOR_ANGLES = np.array([40.0, -40.0, 100.0, -100.0, 150.0, -150.0])
+_SENSOR_DISTS = np.array([0.4, 0.4, 0.3, 0.3, 0.35, 0.35])
+
+# Odor sums are float32; readings at or below 1e-7 (as float32) count as none
+_ODOR_FLOOR = float(np.float32(1e-7))
+
+
 class Nociceptor:
-    """Pain receptor with position and pain value"""
-    def __init__(self, id_name, parent):
+    """
+    Pain receptor with position and pain value.
+    Position and pain are stored in the parent slug's per-sensor arrays
+    (so all 7 can be updated with one NumPy op); a nociceptor created
+    without an index gets its own storage.
+    """
+    def __init__(self, id_name, parent, index=None):
         self.id = id_name
         self.parent = parent
-        self.x = 0
-        self.y = 0
-        self.painval = 0.0
+        if index is None:
+            self._xs = np.zeros(1)
+            self._ys = np.zeros(1)
+            self._pains = np.zeros(1)
+            self._idx = 0
+        else:
+            self._xs = parent._nocx
+            self._ys = parent._nocy
+            self._pains = parent._painval
+            self._idx = index
         self.hit = False
 
+    @property
+    def x(self):
+        return self._xs[self._idx]
+
+    @x.setter
+    def x(self, value):
+        self._xs[self._idx] = value
+
+    @property
+    def y(self):
+        return self._ys[self._idx]
+
+    @y.setter
+    def y(self, value):
+        self._ys[self._idx] = value
+
+    @property
+    def painval(self):
+        return self._pains[self._idx]
+
+    @painval.setter
+    def painval(self, value):
+        self._pains[self._idx] = value
+
+
+class SlugPath:
+    """
+    The last `maxlen` positions of a slug, oldest first.
+    Each point is written twice, `maxlen` rows apart, so the current window
+    is always one contiguous slice and points can be handed to Matplotlib
+    as a view without reordering a ring buffer.
+    """
+    def __init__(self, maxlen):
+        self.maxlen = maxlen
+        self._buf = np.empty((2 * maxlen, 2))
+        self._head = 0
+        self._len = 0
+
+    def append(self, point):
+        head = self._head
+        self._buf[head] = self._buf[head + self.maxlen] = point
+        self._head = (head + 1) % self.maxlen
+        self._len = min(self._len + 1, self.maxlen)
+
+    def __len__(self):
+        return self._len
+
+    @property
+    def points(self):
+        """(n, 2) view of the stored positions, oldest first"""
+        end = self._head + self.maxlen
+        return self._buf[end - self._len:end]
+
+
+# Slug scalars the model's reporters aggregate. Each slug keeps them in its
+# own row of model._slug_state, so a reporter is one column reduction; the
+# leading fields are integer counters
+SLUG_STATE_FIELDS = ("hermi_counter", "flab_counter", "fauxflab_counter", "bite_counter",
+                     "nutrition", "app_state", "Vh_rp", "Vf_rn")
+_NUM_COUNTERS = 4
+
+
+def _state_property(col):
+    """Attribute backed by column `col` of the slug's state row"""
+    if col < _NUM_COUNTERS:
+        def fget(self):
+            return int(self._state.item(col))
+    else:
+        def fget(self):
+            return self._state.item(col)
+
+    def fset(self, value):
+        self._state[col] = value
+
+    return property(fget, fset)
+
 
 class CyberslugAgent(Agent):
     """
@@ -124,15 +229,30 @@ class CyberslugAgent(Agent):
     - Social behaviors
     """
 
-    def __init__(self, unique_id, model):
+    hermi_counter = _state_property(0)
+    flab_counter = _state_property(1)
+    fauxflab_counter = _state_property(2)
+    bite_counter = _state_property(3)
+    nutrition = _state_property(4)
+    app_state = _state_property(5)
+    Vh_rp = _state_property(6)
+    Vf_rn = _state_property(7)
+
+    def __init__(self, unique_id, model, state=None):
         super().__init__(model)
         self.unique_id = unique_id
 
+        # Backing row for the SLUG_STATE_FIELDS properties (a view into the
+        # model's array when created by the model)
+        if state is None:
+            state = np.zeros(len(SLUG_STATE_FIELDS))
+        self._state = state
+
         # Position and movement
         self.angle = 0  # heading in degrees
         self.previous_heading = 0
         self.speed = 0.06
-        self.path = []
+        self.path = SlugPath(maxlen=1000)  # Limit path length (oldest points drop off)
         self.size = 30 + self.random.uniform(0, 10)  # Variable size (5-15)
         self.tick_timer = 10
 
@@ -200,11 +320,11 @@ class CyberslugAgent(Agent):
         self.OV_weight = 2.0  # Oral veil sensors
         self.PB_weight = 1.0  # Body sensors
 
-        # Pain - 7 nociceptors (NetLogo style)
-        self.nociceptors = []
-        nociceptor_ids = ["snsrOL", "snsrOR", "snsrUL", "snsrUR", "snsrBL", "snsrBR", "snsrBM"]
-        for noc_id in nociceptor_ids:
-            self.nociceptors.append(Nociceptor(noc_id, self))
+        # Pain - 7 nociceptors (NetLogo style), backed by these arrays
+        self._nocx = np.zeros(len(_NOC_IDS))
+        self._nocy = np.zeros(len(_NOC_IDS))
+        self._painval = np.zeros(len(_NOC_IDS))
+        self.nociceptors = [Nociceptor(noc_id, self, i) for i, noc_id in enumerate(_NOC_IDS)]
 
         self.sns_pain_left = 0.0
         self.sns_pain_right = 0.0
@@ -296,12 +416,9 @@ class CyberslugAgent(Agent):
 
         # Add to path for visualization
         self.path.append((new_x, new_y))
-        if len(self.path) > 1000:  # Limit path length
-            self.path.pop(0)
 
         # Decay pain from bites and external sources
-        for noc in self.nociceptors:
-            noc.painval *= 0.20  # NetLogo: 0.20 decay
+        self._painval *= 0.20  # NetLogo: 0.20 decay
         self.pain_from_bite *= 0.8
 
         # Decay bite cooldown
@@ -314,26 +431,19 @@ class CyberslugAgent(Agent):
     def update_nociceptor_positions(self):
         """Update positions of all 7 nociceptors (NetLogo style)"""
         x, y = self.pos
-        heading = self.angle
-        size = self.size
-
-        positions = {
-            "snsrOL": (40, 0.4),   # Oral left
-            "snsrOR": (-40, 0.4),  # Oral right (negative angle = right)
-            "snsrUL": (100, 0.3),  # Upper left
-            "snsrUR": (-100, 0.3), # Upper right
-            "snsrBL": (150, 0.35), # Back left
-            "snsrBR": (-150, 0.35),# Back right
-            "snsrBM": (180, 0.46)  # Back middle
-        }
-
-        for noc in self.nociceptors:
-            angle_offset, distance_mult = positions[noc.id]
-            # NetLogo uses: x + dist * sin(heading + offset)
-            # Convert to our coordinate system
-            sensor_angle = heading + angle_offset
-            noc.x = x + (distance_mult * size) * math.cos(math.radians(sensor_angle))
-            noc.y = y + (distance_mult * size) * math.sin(math.radians(sensor_angle))
+        # NetLogo uses: x + dist * sin(heading + offset)
+        # Convert to our coordinate system
+        sensor_angles = math.radians(self.angle) + _NOC_ANGLES
+        dists = _NOC_DISTS * self.size
+        np.multiply(dists, np.cos(sensor_angles), out=self._nocx)
+        np.multiply(dists, np.sin(sensor_angles), out=self._nocy)
+        self._nocx += x
+        self._nocy += y
+
+    @property
+    def nociceptor_points(self):
+        """(7, 3) array of each nociceptor's x, y and pain value"""
+        return np.column_stack((self._nocx, self._nocy, self._painval))
 
     def update_sensors(self):
         """Update sensory input from odor patches (NetLogo style with OV/PB weights)"""
@@ -341,46 +451,17 @@ class CyberslugAgent(Agent):
         heading = self.angle
         size = self.size
 
-        # Get odor readings at each sensor location
-        def get_sensor_odors(angle_offset, distance_mult):
-            sensor_angle = heading + angle_offset
-            sx = x + (distance_mult * size) * math.cos(math.radians(sensor_angle))
-            sy = y + (distance_mult * size) * math.sin(math.radians(sensor_angle))
-            return self.model.get_odor_at_position(sx, sy)
-
-        # Get odors at each sensor (with appropriate weights)
-        # Oral veil sensors (OV_weight = 2)
-        odor_OL = get_sensor_odors(40, 0.4)
-        odor_OR = get_sensor_odors(-40, 0.4)
-
-        # Upper body sensors (PB_weight = 1)
-        odor_UL = get_sensor_odors(100, 0.3)
-        odor_UR = get_sensor_odors(-100, 0.3)
-
-        # Back sensors (PB_weight = 1)
-        odor_BL = get_sensor_odors(150, 0.35)
-        odor_BR = get_sensor_odors(-150, 0.35)
-
-        # Calculate left/right odor sensations with weights
+        # Odor readings at the oral veil (OV_weight), upper body and back
+        # (PB_weight) sensors, weighted and summed per side
         # odor format: [betaine, hermi, flab, drug, pleur]
-        def weighted_sum(sensors_list, weights_list):
-            result = [0.0] * 5
-            for sensor, weight in zip(sensors_list, weights_list):
-                for i in range(5):
-                    result[i] += weight * sensor[i]
-            return result
-
-        # Left side: OL (oral, weight=2), UL, BL (upper/back, weight=1 each)
-        odor_left = weighted_sum([odor_OL, odor_UL, odor_BL],
-                                  [self.OV_weight, self.PB_weight, self.PB_weight])
-
-        # Right side: OR (oral, weight=2), UR, BR (upper/back, weight=1 each)
-        odor_right = weighted_sum([odor_OR, odor_UR, odor_BR],
-                                   [self.OV_weight, self.PB_weight, self.PB_weight])
+        weights = np.array((self.OV_weight, self.OV_weight, self.PB_weight,
+                            self.PB_weight, self.PB_weight, self.PB_weight), dtype=np.float32)
+        odor_left, odor_right = self.model.get_sensor_odor_sums(
+            x, y, float(heading), size, _SENSOR_ANGLES, _SENSOR_DISTS, weights).tolist()
 
         # Convert to log scale (NetLogo style)
         def to_log_scale(odors):
-            return [0 if val <= 1e-7 else (7 + math.log10(val)) for val in odors]
+            return [0 if val <= _ODOR_FLOOR else (7 + math.log10(val)) for val in odors]
 
         self.sns_odors_left = to_log_scale(odor_left)
         self.sns_odors_right = to_log_scale(odor_right)
@@ -391,17 +472,17 @@ class CyberslugAgent(Agent):
 
     def update_pain_sensors(self):
         """Calculate pain sensation from nociceptors"""
+        # Unpacking 7 floats is much cheaper than 3 small NumPy reductions
+        OL, OR, UL, UR, BL, BR, BM = self._painval.tolist()
+
         # Pain on left side (OL, UL, BL)
-        left_nocs = [n for n in self.nociceptors if n.id in ["snsrOL", "snsrUL", "snsrBL"]]
-        self.sns_pain_left = sum(n.painval for n in left_nocs)
+        self.sns_pain_left = OL + UL + BL
 
         # Pain on right side (OR, UR, BR)
-        right_nocs = [n for n in self.nociceptors if n.id in ["snsrOR", "snsrUR", "snsrBR"]]
-        self.sns_pain_right = sum(n.painval for n in right_nocs)
+        self.sns_pain_right = OR + UR + BR
 
         # Pain at caudal end (BL, BR, BM)
-        caud_nocs = [n for n in self.nociceptors if n.id in ["snsrBL", "snsrBR", "snsrBM"]]
-        self.sns_pain_caud = sum(n.painval for n in caud_nocs)
+        self.sns_pain_caud = BL + BR + BM
 
         # Total pain
         self.sns_pain_total = (self.sns_pain_left + self.sns_pain_right) / 2
@@ -426,23 +507,26 @@ class CyberslugAgent(Agent):
         self.is_biting = False
         self.collision = 0
 
-        # Get nearby slugs
-        neighbors = self.model.space.get_neighbors(
-            (x, y),
-            radius=50,
-            include_center=False
-        )
-
-        for neighbor in neighbors:
-            if isinstance(neighbor, CyberslugAgent) and neighbor != self:
+        # Scan the model's slug list directly rather than a space query over
+        # every agent: the bite reach (0.7 * size, at most 28) lies well
+        # inside the 50-unit neighborhood that query used
+        reach = 0.7 * self.size
+        for neighbor in self.model.cyberslugs:
+            if neighbor is not self:
                 nx, ny = neighbor.pos
-                distance = math.sqrt((x - nx)**2 + (y - ny)**2)
-
-                # Check if in bite cone (0.7 * size, 45 degrees)
-                angle_to_neighbor = math.degrees(math.atan2(ny - y, nx - x))
+                dx = nx - x
+                dy = ny - y
+
+                # Check if in bite cone (0.7 * size, 45 degrees); the cheap
+                # squared-distance test goes first so atan2 only runs in range
+                # (a slug on exactly the same spot was never a neighbor)
+                d2 = dx * dx + dy * dy
+                if d2 >= reach * reach or d2 == 0:
+                    continue
+                angle_to_neighbor = math.degrees(math.atan2(dy, dx))
                 angle_diff = abs((angle_to_neighbor - self.angle + 180) % 360 - 180)
 
-                if distance < (0.7 * self.size) and angle_diff < 45:
+                if angle_diff < 45:
                     self.collision = 1  # Collision detected
 
                     # Bite if M > M0 (NetLogo condition: high conspecific odor)
@@ -463,9 +547,9 @@ class CyberslugAgent(Agent):
 
         # Apply pain to target's nociceptors based on distance (NetLogo style)
         target.被咬_counter += 1
+        dists = np.hypot(target._nocx - bite_x, target._nocy - bite_y)
+        target._painval += 20.0 / (dists + 0.1)
         for noc in target.nociceptors:
-            dist = math.sqrt((noc.x - bite_x)**2 + (noc.y - bite_y)**2)
-            noc.painval += 20.0 / (dist + 0.1)
             noc.hit = True
 
     def check_encounters(self):
@@ -482,15 +566,19 @@ class CyberslugAgent(Agent):
 
         for neighbor in neighbors:
             if isinstance(neighbor, PreyAgent):
-                # Calculate distance
                 nx, ny = neighbor.pos
-                distance = math.sqrt((x - nx)**2 + (y - ny)**2)
-
-                # Check collision (within bite cone)
-                angle_to_prey = math.degrees(math.atan2(ny - y, nx - x))
+                dx = nx - x
+                dy = ny - y
+                reach = 0.4 * self.size
+
+                # Check collision (within bite cone); squared distance first
+                # so atan2 only runs for prey that are actually in range
+                if dx * dx + dy * dy >= reach * reach:
+                    continue
+                angle_to_prey = math.degrees(math.atan2(dy, dx))
                 angle_diff = abs((angle_to_prey - self.angle + 180) % 360 - 180)
 
-                if distance < (0.4 * self.size) and angle_diff < 45:
+                if angle_diff < 45:
                     encounter = neighbor.prey_type
                     neighbor.respawn()
                     break  # Only one encounter per step
@@ -617,130 +705,92 @@ class CyberslugAgent(Agent):
         - R+, R-, NR neurons
         - Association strengths (V) and synaptic weights (W)
         - Dynamic baselines (V0)
+        The state is read into locals once and written back once at the end
+        (Vh_rp and Vf_rn are array-backed properties); the arithmetic is the
+        NetLogo circuit, term for term.
         """
+        exp = math.exp
         sns_hermi = self.sns_odors[1]
         sns_flab = self.sns_odors[2]
 
-        # Set CS neuron activity based on odor sensation
-        if sns_hermi > 0:
-            self.CS1 = sns_hermi
-        if sns_flab > 0:
-            self.CS2 = sns_flab
-
-        # Decay eligibility traces for CS neurons (NetLogo: 0.8 decay)
-        self.CS1 *= 0.8
-        self.CS2 *= 0.8
+        # Set CS neuron activity based on odor sensation, then decay the
+        # eligibility traces for CS neurons (NetLogo: 0.8 decay)
+        CS1 = (sns_hermi if sns_hermi > 0 else self.CS1) * 0.8
+        CS2 = (sns_flab if sns_flab > 0 else self.CS2) * 0.8
 
         # Decay reward inputs (eligibility traces)
-        self.R_pos_input *= 0.8
-        self.R_neg_input *= 0.8
+        R_pos_input = self.R_pos_input * 0.8
+        R_neg_input = self.R_neg_input * 0.8
+
+        Wh_rp, Wh_rn, Wh_n = self.Wh_rp, self.Wh_rn, self.Wh_n
+        Wf_rp, Wf_rn, Wf_n = self.Wf_rp, self.Wf_rn, self.Wf_n
+        NR = self.NR
 
         # Calculate reward neuron activities (NetLogo formulas with sigmoids)
         # R+ neuron: receives input from CS1, CS2, reward input, inhibited by NR
-        self.R_pos = 1 / (1 + math.exp(-10 * (
-            self.Wh_rp * self.CS1 +
-            self.Wf_rp * self.CS2 -
-            0.5 * self.NR +
-            self.R_pos_input
-        ) + 8))
+        R_pos = 1 / (1 + exp(-10 * (Wh_rp * CS1 + Wf_rp * CS2 - 0.5 * NR + R_pos_input) + 8))
 
         # R- neuron: receives input from CS2, CS1, negative reward input, inhibited by NR
-        self.R_neg = 1 / (1 + math.exp(-10 * (
-            self.Wf_rn * self.CS2 +
-            self.Wh_rn * self.CS1 -
-            0.5 * self.NR +
-            self.R_neg_input
-        ) + 8))
+        R_neg = 1 / (1 + exp(-10 * (Wf_rn * CS2 + Wh_rn * CS1 - 0.5 * NR + R_neg_input) + 8))
 
         # NR neuron: receives input from CS1, CS2, spontaneous activity, inhibited by R+ and R-
-        self.NR = 1 / (1 + math.exp(-4 * (
-            self.Wh_n * self.CS1 +
-            self.Wf_n * self.CS2 -
-            self.R_pos -
-            self.R_neg +
-            2 * self.NR_spontaneous
-        ) + 7))
-
-        # Calculate changes in association strength (NetLogo: learning rate 0.1)
-        dVh_rp = 0.1 * self.CS1 * self.R_pos
-        dVh_rn = 0.1 * self.CS1 * self.R_neg
-        dVf_rp = 0.1 * self.CS2 * self.R_pos
-        dVf_rn = 0.1 * self.CS2 * self.R_neg
-        dVh_n = 0.1 * self.CS1 * self.NR
-        dVf_n = 0.1 * self.CS2 * self.NR
-
-        # Update association strengths (only when not saturated)
-        self.Vh_rp += (1 - self.Wh_rp) * dVh_rp
-        self.Vh_rn += (1 - self.Wh_rn) * dVh_rn
-        self.Vf_rp += (1 - self.Wf_rp) * dVf_rp
-        self.Vf_rn += (1 - self.Wf_rn) * dVf_rn
-        self.Vh_n += (1 - self.Wh_n) * dVh_n
-        self.Vf_n += (1 - self.Wf_n) * dVf_n
-
-        # Apply forgetting (NetLogo: constant decrease of 0.08)
-        self.Vh_rp -= 0.08
-        self.Vh_rn -= 0.08
-        self.Vf_rp -= 0.08
-        self.Vf_rn -= 0.08
-        self.Vh_n -= 0.08
-        self.Vf_n -= 0.08
-
-        # Ensure association strengths don't drop below baseline
-        self.Vh_rp = max(self.Vh_rp, self.Vh_rp0)
-        self.Vh_rn = max(self.Vh_rn, self.Vh_rn0)
-        self.Vf_rp = max(self.Vf_rp, self.Vf_rp0)
-        self.Vf_rn = max(self.Vf_rn, self.Vf_rn0)
-        self.Vh_n = max(self.Vh_n, self.Vh_n0)
-        self.Vf_n = max(self.Vf_n, self.Vf_n0)
+        NR = 1 / (1 + exp(-4 * (Wh_n * CS1 + Wf_n * CS2 - R_pos - R_neg +
+                                2 * self.NR_spontaneous) + 7))
+
+        # Update association strengths by the changes (NetLogo: learning rate
+        # 0.1; only when not saturated), apply forgetting (NetLogo: constant
+        # decrease of 0.08) and keep them from dropping below baseline
+        Vh_rp = max(self.Vh_rp + (1 - Wh_rp) * (0.1 * CS1 * R_pos) - 0.08, self.Vh_rp0)
+        Vh_rn = max(self.Vh_rn + (1 - Wh_rn) * (0.1 * CS1 * R_neg) - 0.08, self.Vh_rn0)
+        Vf_rp = max(self.Vf_rp + (1 - Wf_rp) * (0.1 * CS2 * R_pos) - 0.08, self.Vf_rp0)
+        Vf_rn = max(self.Vf_rn + (1 - Wf_rn) * (0.1 * CS2 * R_neg) - 0.08, self.Vf_rn0)
+        Vh_n = max(self.Vh_n + (1 - Wh_n) * (0.1 * CS1 * NR) - 0.08, self.Vh_n0)
+        Vf_n = max(self.Vf_n + (1 - Wf_n) * (0.1 * CS2 * NR) - 0.08, self.Vf_n0)
 
         # Calculate synaptic weights from association strengths (sigmoid)
-        self.Wh_rp = 1 / (1 + math.exp(-10 * self.Vh_rp + 8))
-        self.Wh_rn = 1 / (1 + math.exp(-10 * self.Vh_rn + 8))
-        self.Wf_rp = 1 / (1 + math.exp(-10 * self.Vf_rp + 8))
-        self.Wf_rn = 1 / (1 + math.exp(-10 * self.Vf_rn + 8))
-        self.Wh_n = 1 / (1 + math.exp(-10 * self.Vh_n + 8))
-        self.Wf_n = 1 / (1 + math.exp(-10 * self.Vf_n + 8))
+        Wh_rp = 1 / (1 + exp(-10 * Vh_rp + 8))
+        Wh_rn = 1 / (1 + exp(-10 * Vh_rn + 8))
+        Wf_rp = 1 / (1 + exp(-10 * Vf_rp + 8))
+        Wf_rn = 1 / (1 + exp(-10 * Vf_rn + 8))
+        Wh_n = 1 / (1 + exp(-10 * Vh_n + 8))
+        Wf_n = 1 / (1 + exp(-10 * Vf_n + 8))
 
         # Check for saturation (NetLogo: threshold 0.83)
-        if self.Wh_rp > 0.83:
+        if Wh_rp > 0.83:
             self.Wh_rp_saturated = 1
-        if self.Wh_rn > 0.83:
+        if Wh_rn > 0.83:
             self.Wh_rn_saturated = 1
-        if self.Wf_rp > 0.83:
+        if Wf_rp > 0.83:
             self.Wf_rp_saturated = 1
-        if self.Wf_rn > 0.83:
+        if Wf_rn > 0.83:
             self.Wf_rn_saturated = 1
-        if self.Wh_n > 0.83:
+        if Wh_n > 0.83:
             self.Wh_n_saturated = 1
-        if self.Wf_n > 0.83:
+        if Wf_n > 0.83:
             self.Wf_n_saturated = 1
 
         # Update dynamic baselines (NetLogo formulas)
         # Baselines decrease when CS is paired with opposite reward
-        self.Vh_rp0 = self.Wh_rp_saturated * (0.7 - 0.5 / (1 + math.exp(-5 * (
-            self.CS1 * self.R_neg + 0.2 * self.CS1 * self.NR
-        ) + 4)))
-
-        self.Vh_rn0 = self.Wh_rn_saturated * (0.7 - 0.5 / (1 + math.exp(-5 * (
-            self.CS1 * self.R_pos + 0.2 * self.CS1 * self.NR
-        ) + 4)))
-
-        self.Vf_rp0 = self.Wf_rp_saturated * (0.7 - 0.5 / (1 + math.exp(-5 * (
-            self.CS2 * self.R_neg + 0.2 * self.CS2 * self.NR
-        ) + 4)))
-
-        self.Vf_rn0 = self.Wf_rn_saturated * (0.7 - 0.5 / (1 + math.exp(-5 * (
-            self.CS2 * self.R_pos + 0.2 * self.CS2 * self.NR
-        ) + 4)))
-
-        self.Vh_n0 = self.Wh_n_saturated * (0.7 - 0.5 / (1 + math.exp(-5 * (
-            self.CS1 * self.R_neg + 0.2 * self.CS1 * self.R_pos
-        ) + 4)))
-
-        self.Vf_n0 = self.Wf_n_saturated * (0.7 - 0.5 / (1 + math.exp(-5 * (
-            self.CS2 * self.R_neg + 0.2 * self.CS2 * self.R_pos
-        ) + 4)))
+        self.Vh_rp0 = self.Wh_rp_saturated * (0.7 - 0.5 / (1 + exp(-5 * (
+            CS1 * R_neg + 0.2 * CS1 * NR) + 4)))
+        self.Vh_rn0 = self.Wh_rn_saturated * (0.7 - 0.5 / (1 + exp(-5 * (
+            CS1 * R_pos + 0.2 * CS1 * NR) + 4)))
+        self.Vf_rp0 = self.Wf_rp_saturated * (0.7 - 0.5 / (1 + exp(-5 * (
+            CS2 * R_neg + 0.2 * CS2 * NR) + 4)))
+        self.Vf_rn0 = self.Wf_rn_saturated * (0.7 - 0.5 / (1 + exp(-5 * (
+            CS2 * R_pos + 0.2 * CS2 * NR) + 4)))
+        self.Vh_n0 = self.Wh_n_saturated * (0.7 - 0.5 / (1 + exp(-5 * (
+            CS1 * R_neg + 0.2 * CS1 * R_pos) + 4)))
+        self.Vf_n0 = self.Wf_n_saturated * (0.7 - 0.5 / (1 + exp(-5 * (
+            CS2 * R_neg + 0.2 * CS2 * R_pos) + 4)))
 
         # Additional CS decay (NetLogo: 0.9 decay for eligibility)
-        self.CS1 *= 0.9
-        self.CS2 *= 0.9
\ No newline at end of file
+        self.CS1 = CS1 * 0.9
+        self.CS2 = CS2 * 0.9
+        self.R_pos_input = R_pos_input
+        self.R_neg_input = R_neg_input
+        self.R_pos, self.R_neg, self.NR = R_pos, R_neg, NR
+        self.Vh_rp, self.Vh_rn, self.Vh_n = Vh_rp, Vh_rn, Vh_n
+        self.Vf_rp, self.Vf_rn, self.Vf_n = Vf_rp, Vf_rn, Vf_n
+        self.Wh_rp, self.Wh_rn, self.Wh_n = Wh_rp, Wh_rn, Wh_n
+        self.Wf_rp, self.Wf_rn, self.Wf_n = Wf_rp, Wf_rn, Wf_n
\ No newline at end of file
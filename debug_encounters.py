@@ -15,26 +15,23 @@ slug = model.cyberslugs[0]
 print("=== INITIAL STATE ===")
 print(f"Slug position: {slug.pos}")
 print(f"Slug size: {slug.size}")
-print(f"Number of prey in model: {sum(1 for a in model.schedule.agents if hasattr(a, 'prey_type'))}")
+print(f"Number of prey in model: {len(model.prey_agents)}")
 
 # Run for 100 steps and track distances
 for i in range(100):
     model.step()
 
     # Find closest hermi
-    from agents import PreyAgent
-
     min_dist = float('inf')
     closest_prey = None
 
-    for agent in model.schedule.agents:
-        if isinstance(agent, PreyAgent) and agent.prey_type == 'hermi':
-            px, py = agent.pos
-            sx, sy = slug.pos
-            dist = math.sqrt((px - sx) ** 2 + (py - sy) ** 2)
-            if dist < min_dist:
-                min_dist = dist
-                closest_prey = agent
+    for agent in model.prey_by_type['hermi']:
+        px, py = agent.pos
+        sx, sy = slug.pos
+        dist = math.sqrt((px - sx) ** 2 + (py - sy) ** 2)
+        if dist < min_dist:
+            min_dist = dist
+            closest_prey = agent
 
     if i % 20 == 0:
         print(f"\nStep {i}:")
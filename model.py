@@ -11,7 +11,14 @@ import numpy as np
 import math
 from mesa import Model, Agent
 from mesa.space import ContinuousSpace
-from mesa.datacollection import DataCollector
+
+from agents import SLUG_STATE_FIELDS, CyberslugAgent, PreyAgent
+
+try:
+    import numba
+except ImportError:
+    # Numba is optional; the NumPy stencil and a Python sensor loop are used instead
+    numba = None
 
 try:
     from mesa.time import RandomActivation
@@ -21,23 +28,147 @@ except ImportError:
         def __init__(self, model):
             self.model = model
             self.agents = []
-            self._agents = {}
 
         def add(self, agent):
             self.agents.append(agent)
-            self._agents[agent.unique_id] = agent
 
         def remove(self, agent):
             self.agents.remove(agent)
-            del self._agents[agent.unique_id]
 
         def step(self):
-            agents = list(self.agents)
-            self.model.random.shuffle(agents)
-            for agent in agents:
+            # Shuffle the canonical list in place instead of copying it first;
+            # no agent adds or removes agents while the schedule is stepping
+            self.model.random.shuffle(self.agents)
+            for agent in self.agents:
                 agent.step()
 
 
+# Legacy get_sensors samples at heading +- 45 degrees
+_COS45 = math.cos(math.radians(45))
+_SIN45 = math.sin(math.radians(45))
+
+
+if numba is not None:
+    # No fastmath: reassociating the 8-neighbor sum made the result depend on
+    # buffer alignment, so seeded runs did not reproduce
+    @numba.njit(parallel=True, cache=True)
+    def _diffuse(src, dst, self_coef, nbr_coef, channels):
+        """Wrap-around 8-neighbor diffusion of the given odor channels from src into dst"""
+        h, w = src.shape[1], src.shape[2]
+        for k in numba.prange(channels.shape[0]):
+            c = channels[k]
+            a = self_coef[c]
+            b = nbr_coef[c]
+            for i in range(h):
+                im = i - 1 if i > 0 else h - 1
+                ip = i + 1 if i < h - 1 else 0
+                # Only the first and last columns wrap; keeping them out of
+                # the inner loop leaves it branch-free so LLVM vectorizes it
+                for j in (0, w - 1):
+                    jm = j - 1 if j > 0 else w - 1
+                    jp = j + 1 if j < w - 1 else 0
+                    s = (src[c, im, jm] + src[c, im, j] + src[c, im, jp] +
+                         src[c, i, jm] + src[c, i, jp] +
+                         src[c, ip, jm] + src[c, ip, j] + src[c, ip, jp])
+                    dst[c, i, j] = a * src[c, i, j] + b * s
+                for j in range(1, w - 1):
+                    s = (src[c, im, j - 1] + src[c, im, j] + src[c, im, j + 1] +
+                         src[c, i, j - 1] + src[c, i, j + 1] +
+                         src[c, ip, j - 1] + src[c, ip, j] + src[c, ip, j + 1])
+                    dst[c, i, j] = a * src[c, i, j] + b * s
+
+    @numba.njit(cache=True)
+    def _sense_odors(patches, x, y, heading, size, angles, dists, weights,
+                     scale, px_offset, py_offset, pw_max, ph_max):
+        """
+        Weighted float32 odor sums of the sensors around (x, y): even sensors
+        go into row 0 (left), odd ones into row 1 (right)
+        """
+        sums = np.zeros((2, patches.shape[0]), dtype=np.float32)
+        for k in range(angles.shape[0]):
+            r = dists[k] * size
+            a = math.radians(heading + angles[k])
+            px = int((x + r * math.cos(a)) * scale + px_offset)
+            py = int((y + r * math.sin(a)) * scale + py_offset)
+            px = max(0, min(pw_max, px))
+            py = max(0, min(ph_max, py))
+            for c in range(patches.shape[0]):
+                sums[k % 2, c] += weights[k] * patches[c, px, py]
+        return sums
+else:
+    _diffuse = None
+    _sense_odors = None
+
+
+class ModelLog:
+    """
+    Stand-in for Mesa's DataCollector (model reporters only). Each collect()
+    writes one row of a preallocated NumPy record array, grown by doubling,
+    instead of appending a deep copy to one Python list per reporter.
+    """
+
+    def __init__(self, model_reporters, capacity=1024):
+        self.model_reporters = model_reporters
+        self._reporters = tuple(model_reporters.values())
+        self._capacity = capacity
+        self._rows = None  # allocated on the first collect, once dtypes are known
+        self._n = 0
+
+    def collect(self, model):
+        """Record every reporter's current value as the next row"""
+        row = tuple(reporter(model) for reporter in self._reporters)
+        if self._rows is None:
+            # Integer reporters get an integer column, everything else float64
+            dtype = [(name, np.int64 if isinstance(value, (int, np.integer)) else np.float64)
+                     for name, value in zip(self.model_reporters, row)]
+            self._rows = np.empty(self._capacity, dtype=dtype)
+        elif self._n == len(self._rows):
+            grown = np.empty(2 * len(self._rows), dtype=self._rows.dtype)
+            grown[:self._n] = self._rows
+            self._rows = grown
+        self._rows[self._n] = row
+        self._n += 1
+
+    def clear(self):
+        """Drop every collected row, keeping the allocated buffer"""
+        self._n = 0
+
+    @property
+    def model_vars(self):
+        """Collected values per reporter, like DataCollector.model_vars"""
+        if self._rows is None:
+            return {name: [] for name in self.model_reporters}
+        rows = self._rows[:self._n]
+        return {name: rows[name].tolist() for name in self.model_reporters}
+
+    def get_model_vars_dataframe(self):
+        """All collected rows as a DataFrame, one column per reporter"""
+        import pandas as pd
+        if self._rows is None:
+            return pd.DataFrame(columns=list(self.model_reporters))
+        return pd.DataFrame(self._rows[:self._n])
+
+
+# Prey species in creation order (also the row order of model._clusters):
+# (prey_type, display color, odor as [betaine, hermi, flab, drug, pleur])
+PREY_SPECIES = (
+    ("hermi", (0, 255, 255), (0.5, 0.5, 0, 0, 0)),          # Hermissenda (cyan/green)
+    ("flab", (255, 105, 180), (0.5, 0, 0.5, 0, 0)),          # Flabellina (pink/red)
+    ("fauxflab", (255, 255, 0), (0.0, 0.0, 0.5, 0.0, 0)),    # Faux-Flabellina: flab odor, no betaine
+)
+
+
+def _cluster_property(row, col):
+    """Named accessor for one coordinate of model._clusters"""
+    def fget(self):
+        return self._clusters.item(row, col)
+
+    def fset(self, value):
+        self._clusters[row, col] = value
+
+    return property(fget, fset)
+
+
 class CyberSlugModel(Model):
     """
     A model simulating multiple Cyberslugs with ALL NetLogo features.
@@ -47,6 +178,20 @@ class CyberSlugModel(Model):
     - Odor-null mode (for testing)
     """
 
+    hermi_cluster_x = _cluster_property(0, 0)
+    hermi_cluster_y = _cluster_property(0, 1)
+    flab_cluster_x = _cluster_property(1, 0)
+    flab_cluster_y = _cluster_property(1, 1)
+    fauxflab_cluster_x = _cluster_property(2, 0)
+    fauxflab_cluster_y = _cluster_property(2, 1)
+
+    @property
+    def cluster_centers(self):
+        """Read-only (3, 2) view of the cluster centers, rows in PREY_SPECIES order"""
+        centers = self._clusters.view()
+        centers.flags.writeable = False
+        return centers
+
     def __init__(self,
                  width=600,
                  height=600,
@@ -62,8 +207,10 @@ class CyberSlugModel(Model):
                  biting=True,
                  odor_null=False,
                  fix_satiation_override=False,
-                 fix_satiation_value=1.0):
-        super().__init__()
+                 fix_satiation_value=1.0,
+                 collect_every=1,
+                 seed=None):
+        super().__init__(seed=seed)
 
         # Dimensions
         self.width = width
@@ -71,6 +218,11 @@ class CyberSlugModel(Model):
         self.patch_width = patch_width
         self.patch_height = patch_height
         self.scale = patch_width / width
+        # World -> patch is a single multiply-add; precompute its terms
+        self._px_offset = patch_width / 2 - (width / 2) * self.scale
+        self._py_offset = patch_height / 2 - (height / 2) * self.scale
+        self._pw_max = patch_width - 1
+        self._ph_max = patch_height - 1
 
         # Grid setup - continuous space for movement
         self.space = ContinuousSpace(width, height, torus=True)
@@ -79,8 +231,30 @@ class CyberSlugModel(Model):
         self.schedule = RandomActivation(self)
 
         # Odor patches - 5 types: betaine, hermi, flab, drug, pleur (conspecific)
+        # float32 is plenty for a smoothed concentration field and halves the
+        # memory traffic of the (memory-bound) diffusion stencil
         self.num_odor_types = 5
-        self.patches = np.zeros((self.num_odor_types, patch_width, patch_height))
+        self.patches = np.zeros((self.num_odor_types, patch_width, patch_height), dtype=np.float32)
+
+        # NetLogo: hermi, flab, betaine diffuse at 1.0, pleur at 0.5
+        # [betaine, hermi, flab, drug, pleur]
+        self._diff_rates = np.array([1.0, 1.0, 1.0, 1.0, 0.5])
+        self._evap = 0.95  # NetLogo evaporation rate
+
+        # Per-channel mixing coefficients with evaporation folded in:
+        # field = self_coef * field + nbr_coef * neighbors_sum
+        self._self_coef = (self._evap * (1.0 - self._diff_rates)).astype(np.float32)
+        self._nbr_coef = (self._evap * self._diff_rates / 8.0).astype(np.float32)
+
+        # Diffusion reads from self.patches and writes into this second grid,
+        # then the two are swapped; the scratch grid backs the NumPy fallback
+        self._patches_next = np.zeros_like(self.patches)
+        self._scratch = np.empty_like(self.patches)
+
+        # Prey deposits queued during a tick (positions and odor vectors),
+        # applied with the slug deposits in one scatter-add next tick
+        self._queued_pos = []
+        self._queued_odor = []
 
         # Simulation parameters
         self.prey_radius = 4
@@ -97,19 +271,51 @@ class CyberSlugModel(Model):
         self.fix_satiation_override = fix_satiation_override
         self.fix_satiation_value = fix_satiation_value
 
+        # Collect reporter data every `collect_every` ticks (1 = every tick)
+        self.collect_every = collect_every
+
         # Population settings
         self.num_slugs = num_slugs
         self.hermi_population = hermi_population
         self.flab_population = flab_population
         self.fauxflab_population = fauxflab_population
 
-        # Cluster centers (NetLogo style)
-        self.hermi_cluster_x = self.random.randrange(width)
-        self.hermi_cluster_y = self.random.randrange(height)
-        self.flab_cluster_x = self.random.randrange(width)
-        self.flab_cluster_y = self.random.randrange(height)
-        self.fauxflab_cluster_x = self.random.randrange(width)
-        self.fauxflab_cluster_y = self.random.randrange(height)
+        # Mesa < 3.1 has no NumPy Generator on the model; derive one from
+        # the seeded stdlib RNG so runs stay reproducible
+        if getattr(self, "rng", None) is None:
+            self.rng = np.random.default_rng(self.random.getrandbits(64))
+
+        self._world_size = np.array([width, height], dtype=np.float64)
+
+        # Per-slug scalars the reporters aggregate, one row per slug (each
+        # CyberslugAgent reads and writes its row through properties)
+        self._slug_state = np.zeros((num_slugs, len(SLUG_STATE_FIELDS)))
+        (HERMI, FLAB, FAUXFLAB, BITES,
+         NUTRITION, APP_STATE, VH_RP, VF_RN) = range(len(SLUG_STATE_FIELDS))
+
+        # Data collector
+        self.datacollector = ModelLog(
+            model_reporters={
+                "Ticks": lambda m: m.ticks,
+                "Total_Hermi_Eaten": lambda m: int(m._slug_state[:, HERMI].sum()),
+                "Total_Flab_Eaten": lambda m: int(m._slug_state[:, FLAB].sum()),
+                "Total_Fauxflab_Eaten": lambda m: int(m._slug_state[:, FAUXFLAB].sum()),
+                "Total_Bites": lambda m: int(m._slug_state[:, BITES].sum()),
+                "Avg_Nutrition": lambda m: m._slug_state[:, NUTRITION].mean() if m.cyberslugs else 0,
+                "Avg_AppState": lambda m: m._slug_state[:, APP_STATE].mean() if m.cyberslugs else 0,
+                "Avg_Vh_rp": lambda m: m._slug_state[:, VH_RP].mean() if m.cyberslugs else 0,
+                "Avg_Vf_rn": lambda m: m._slug_state[:, VF_RN].mean() if m.cyberslugs else 0,
+            }
+        )
+
+        self._initialize_state()
+
+    def _initialize_state(self):
+        """Set up everything a run starts from: clusters, counters and agents"""
+        # Cluster centers (NetLogo style), rows [hermi, flab, fauxflab] of
+        # (x, y); the *_cluster_x/y attributes are views onto this array
+        self._clusters = np.array([[self.random.randrange(self.width), self.random.randrange(self.height)]
+                                   for _ in range(3)], dtype=np.float64)
 
         # Step counter
         self.ticks = 0
@@ -118,146 +324,234 @@ class CyberSlugModel(Model):
         # Track all slugs
         self.cyberslugs = []
 
+        # All prey, stepped together by _step_prey, and the same agents by
+        # prey_type (add/remove them with add_prey/remove_prey so these and
+        # the schedule stay in sync)
+        self.prey_agents = []
+        self.prey_by_type = {prey_type: [] for prey_type, _, _ in PREY_SPECIES}
+
         # For user interactions
         self.being_observed = None  # Selected slug for detailed observation
         self.mouse_x = 0
         self.mouse_y = 0
         self.mouse_down = False
 
-        # Data collector
-        self.datacollector = DataCollector(
-            model_reporters={
-                "Ticks": lambda m: m.ticks,
-                "Total_Hermi_Eaten": lambda m: sum([s.hermi_counter for s in m.cyberslugs]),
-                "Total_Flab_Eaten": lambda m: sum([s.flab_counter for s in m.cyberslugs]),
-                "Total_Fauxflab_Eaten": lambda m: sum([s.fauxflab_counter for s in m.cyberslugs]),
-                "Total_Bites": lambda m: sum([s.bite_counter for s in m.cyberslugs]),
-                "Avg_Nutrition": lambda m: np.mean([s.nutrition for s in m.cyberslugs]) if m.cyberslugs else 0,
-                "Avg_AppState": lambda m: np.mean([s.app_state for s in m.cyberslugs]) if m.cyberslugs else 0,
-                "Avg_Vh_rp": lambda m: np.mean([s.Vh_rp for s in m.cyberslugs]) if m.cyberslugs else 0,
-                "Avg_Vf_rn": lambda m: np.mean([s.Vf_rn for s in m.cyberslugs]) if m.cyberslugs else 0,
-            }
-        )
-
         # Create agents
+        self._slug_state.fill(0.0)
         self._create_agents()
 
+    def reset(self, seed=None):
+        """
+        Start a new run on this model, keeping its configuration and reusing
+        the odor grids and data log buffers. `seed` reseeds both RNGs
+        (None reuses the model's current seed, as Mesa's reset_randomizer).
+        """
+        for agent in self.schedule.agents:
+            self.space.remove_agent(agent)
+            agent.remove()
+        self.schedule.agents.clear()
+
+        self.patches.fill(0.0)
+        self._patches_next.fill(0.0)
+        self._queued_pos.clear()
+        self._queued_odor.clear()
+        self.datacollector.clear()
+
+        self.reset_randomizer(seed)
+        if hasattr(self, "reset_rng"):
+            self.reset_rng(self._seed)
+        else:
+            self.rng = np.random.default_rng(self.random.getrandbits(64))
+
+        self.running = True
+        self._initialize_state()
+
     def _create_agents(self):
         """Create all agents in the simulation"""
-        from agents import CyberslugAgent, PreyAgent
-
-        # Create multiple Cyberslugs
+        # Create multiple Cyberslugs, spread out initially
+        positions = self.sample_positions(self.num_slugs)
         for i in range(self.num_slugs):
-            slug = CyberslugAgent(i, self)
+            slug = CyberslugAgent(i, self, state=self._slug_state[i])
             self.schedule.add(slug)
-            # Spread slugs out initially
-            x = self.random.randrange(self.width)
-            y = self.random.randrange(self.height)
-            self.space.place_agent(slug, (x, y))
+            self.space.place_agent(slug, positions[i])
             self.cyberslugs.append(slug)
 
+        # Slug stepping order, reshuffled in place every tick
+        self._slug_order = list(self.cyberslugs)
+
         # Set first slug as being observed
         self.being_observed = self.cyberslugs[0] if self.cyberslugs else None
 
         # For backwards compatibility
         self.cyberslug = self.being_observed
 
-        # Create Hermissenda prey (cyan/green)
-        base_id = self.num_slugs
-        for i in range(self.hermi_population):
-            prey = PreyAgent(
-                base_id + i,
-                self,
-                prey_type="hermi",
-                color=(0, 255, 255),
-                odor=[0.5, 0.5, 0, 0, 0]  # [betaine, hermi, flab, drug, pleur]
-            )
-            prey.cluster_target = (self.hermi_cluster_x, self.hermi_cluster_y)
-            self.schedule.add(prey)
-
-            if self.clustering:
-                x = self.hermi_cluster_x + self.random.uniform(-self.cluster_radius, self.cluster_radius)
-                y = self.hermi_cluster_y + self.random.uniform(-self.cluster_radius, self.cluster_radius)
-            else:
-                x = self.random.randrange(self.width)
-                y = self.random.randrange(self.height)
-
-            self.space.place_agent(prey, (x, y))
-
-        # Create Flabellina prey (pink/red)
-        base_id = self.num_slugs + self.hermi_population
-        for i in range(self.flab_population):
-            prey = PreyAgent(
-                base_id + i,
-                self,
-                prey_type="flab",
-                color=(255, 105, 180),
-                odor=[0.5, 0, 0.5, 0, 0]
-            )
-            prey.cluster_target = (self.flab_cluster_x, self.flab_cluster_y)
-            self.schedule.add(prey)
-
-            if self.clustering:
-                x = self.flab_cluster_x + self.random.uniform(-self.cluster_radius, self.cluster_radius)
-                y = self.flab_cluster_y + self.random.uniform(-self.cluster_radius, self.cluster_radius)
-            else:
-                x = self.random.randrange(self.width)
-                y = self.random.randrange(self.height)
-
-            self.space.place_agent(prey, (x, y))
-
-        # Create Faux-Flabellina prey (blue)
-        base_id = self.num_slugs + self.hermi_population + self.flab_population
-        for i in range(self.fauxflab_population):
-            prey = PreyAgent(
-                base_id + i,
-                self,
-                prey_type="fauxflab",
-                color=(255, 255, 0),
-                odor=[0.0, 0.0, 0.5, 0.0, 0]  # Only flab odor, no betaine
-            )
-            prey.cluster_target = (self.fauxflab_cluster_x, self.fauxflab_cluster_y)
-            self.schedule.add(prey)
-
-            if self.clustering:
-                x = self.fauxflab_cluster_x + self.random.uniform(-self.cluster_radius, self.cluster_radius)
-                y = self.fauxflab_cluster_y + self.random.uniform(-self.cluster_radius, self.cluster_radius)
-            else:
-                x = self.random.randrange(self.width)
-                y = self.random.randrange(self.height)
-
-            self.space.place_agent(prey, (x, y))
-
-    def step(self):
-        """Advance the model by one step"""
-        # Update cluster centers (NetLogo: slow drift)
+        # Create the prey populations. Each species shares one color tuple,
+        # one float32 odor vector and one cluster target across its agents;
+        # the schedule/space methods are bound once for the whole loop
+        add = self.schedule.add
+        place = self.space.place_agent
+        next_id = self.num_slugs
+        populations = (self.hermi_population, self.flab_population, self.fauxflab_population)
+        for row, (prey_type, color, odor) in enumerate(PREY_SPECIES):
+            n = populations[row]
+            odor = np.asarray(odor, dtype=np.float32)
+            cluster_target = tuple(self._clusters[row].tolist())
+            positions = self.sample_positions(n, self._clusters[row])
+            of_type = self.prey_by_type[prey_type]
+            for i in range(n):
+                prey = PreyAgent(next_id + i, self, prey_type=prey_type, color=color, odor=odor)
+                prey.cluster_target = cluster_target
+                add(prey)
+                place(prey, positions[i])
+                self.prey_agents.append(prey)
+                of_type.append(prey)
+            next_id += n
+
+        # unique_id for the next agent added at runtime (see new_agent_id)
+        self._next_uid = next_id
+
+    def sample_positions(self, n, cluster=None):
+        """
+        Sample n placement positions in one RNG call: around `cluster` when
+        clustering is on, otherwise uniformly on the integer grid
+        """
+        if self.clustering and cluster is not None:
+            r = self.cluster_radius
+            positions = cluster + self.rng.uniform(-r, r, size=(n, 2))
+        else:
+            positions = self.rng.integers(0, (self.width, self.height), size=(n, 2))
+        return [tuple(p) for p in positions.tolist()]
+
+    def step(self, update_odor=True):
+        """
+        Advance the model by one step. update_odor=False leaves the odor
+        patches as they are (no deposits, diffusion or evaporation), for runs
+        that only exercise agent logic.
+        """
+        # Update cluster centers (NetLogo: slow drift), wrapped to stay in bounds
         if self.clustering:
-            self.hermi_cluster_x += self.random.uniform(-0.2, 0.2)
-            self.hermi_cluster_y += self.random.uniform(-0.2, 0.2)
-            self.flab_cluster_x += self.random.uniform(-0.2, 0.2)
-            self.flab_cluster_y += self.random.uniform(-0.2, 0.2)
-            self.fauxflab_cluster_x += self.random.uniform(-0.2, 0.2)
-            self.fauxflab_cluster_y += self.random.uniform(-0.2, 0.2)
-
-            # Keep clusters in bounds
-            self.hermi_cluster_x = self.hermi_cluster_x % self.width
-            self.hermi_cluster_y = self.hermi_cluster_y % self.height
-            self.flab_cluster_x = self.flab_cluster_x % self.width
-            self.flab_cluster_y = self.flab_cluster_y % self.height
-            self.fauxflab_cluster_x = self.fauxflab_cluster_x % self.width
-            self.fauxflab_cluster_y = self.fauxflab_cluster_y % self.height
+            self._clusters += self.rng.uniform(-0.2, 0.2, size=(3, 2))
+            self._clusters %= self._world_size
 
         # Update odor patches BEFORE agent steps
-        self.update_odor_patches()
-
-        # All agents take their step
-        self.schedule.step()
+        if update_odor:
+            self.update_odor_patches()
+        else:
+            # Last tick's queued prey deposits are skipped along with the rest
+            self._queued_pos.clear()
+            self._queued_odor.clear()
+
+        # Prey move together in one vectorized pass, then the slugs take
+        # their steps in random order
+        self._step_prey()
+        slugs = self._slug_order
+        self.random.shuffle(slugs)
+        for slug in slugs:
+            slug.step()
 
         # Increment step counter
         self.ticks = self.steps
 
         # Collect data
-        self.datacollector.collect(self)
+        if self.steps % self.collect_every == 0:
+            self.datacollector.collect(self)
+
+    def get_stats_arrays(self):
+        """
+        Per-slug summary values as NumPy arrays, one entry per slug (the
+        counter and nutrition arrays are views of live state; read only)
+        """
+        state = self._slug_state
+        col = SLUG_STATE_FIELDS.index
+        return {
+            'hermi': state[:, col("hermi_counter")],
+            'flab': state[:, col("flab_counter")],
+            'fauxflab': state[:, col("fauxflab_counter")],
+            'bites': state[:, col("bite_counter")],
+            'nutrition': state[:, col("nutrition")],
+            'size': np.fromiter((s.size for s in self.cyberslugs), dtype=np.float64,
+                                count=len(self.cyberslugs)),
+        }
+
+    def step_many(self, n):
+        """Advance the model by n steps"""
+        step = self.step
+        for _ in range(n):
+            step()
+
+    def new_agent_id(self):
+        """Allocate the unique_id for an agent added at runtime"""
+        uid = self._next_uid
+        self._next_uid += 1
+        return uid
+
+    def add_prey(self, prey, pos):
+        """Register a new prey agent with the schedule, space and prey lists"""
+        self.schedule.add(prey)
+        self.space.place_agent(prey, pos)
+        self.prey_agents.append(prey)
+        self.prey_by_type[prey.prey_type].append(prey)
+
+    def remove_prey(self, prey):
+        """Take a prey agent out of the schedule, space and prey lists"""
+        self.space.remove_agent(prey)
+        self.schedule.remove(prey)
+        self.prey_agents.remove(prey)
+        self.prey_by_type[prey.prey_type].remove(prey)
+
+    def _step_prey(self):
+        """
+        Vectorized PreyAgent.step for every prey: queue each odor deposit at
+        the current position, then turn and move (cluster-seeking or random
+        wandering, or along a manual heading)
+        """
+        prey = self.prey_agents
+        n = len(prey)
+        if not n:
+            return
+
+        positions = [p.pos for p in prey]
+        self._queued_pos += positions
+        self._queued_odor += [p.odor for p in prey]
+
+        pos = np.array(positions, dtype=np.float64)
+        angle = np.fromiter((p.angle for p in prey), dtype=np.float64, count=n)
+        speed = np.fromiter((p.speed for p in prey), dtype=np.float64, count=n)
+        manual = np.fromiter((p.manual_heading for p in prey), dtype=bool, count=n)
+
+        # PreyAgent.move_to_cluster for prey that have a cluster to seek
+        if self.clustering:
+            seeking = np.fromiter((p.cluster_target is not None for p in prey), dtype=bool, count=n)
+        else:
+            seeking = np.zeros(n, dtype=bool)
+        if seeking.any():
+            idx = np.flatnonzero(seeking)
+            target = np.array([prey[i].cluster_target for i in idx], dtype=np.float64)
+            d = target - pos[idx]
+            r = self.cluster_radius
+            outside = (d * d).sum(axis=1) > r * r
+            angle_to_cluster = np.degrees(np.arctan2(d[:, 1], d[:, 0]))
+            angle_diff = (angle_to_cluster - angle[idx] + 180) % 360 - 180
+            wander = (2 * math.sin(math.radians(30 * self.ticks)) - 4
+                      + self.rng.uniform(-8, 8, size=len(idx)))
+            angle[idx] += np.where(outside, angle_diff / 5, wander)
+            speed[idx] = 0.05
+
+        # Random wandering for the rest; manual prey keep to their heading
+        wandering = ~seeking & ~manual
+        angle[wandering] += self.rng.uniform(-1, 1, size=np.count_nonzero(wandering))
+        direction = np.radians(angle)
+        steer = ~seeking & manual
+        if steer.any():
+            direction[steer] = np.radians([prey[i].heading for i in np.flatnonzero(steer)])
+
+        new_x = (pos[:, 0] + speed * np.cos(direction)).tolist()
+        new_y = (pos[:, 1] + speed * np.sin(direction)).tolist()
+        move = None if self.immobilize else self.space.move_agent
+        for p, a, x, y in zip(prey, angle.tolist(), new_x, new_y):
+            p.angle = a
+            if move is not None:
+                move(p, (x, y))
 
     def update_odor_patches(self):
         """
@@ -266,62 +560,144 @@ class CyberSlugModel(Model):
         2) Diffuse to 8 neighbors (Moore neighborhood)
         3) Evaporate
         """
-        # Deposit slug odor based on size/nutrition
-        for slug in self.cyberslugs:
-            x, y = slug.pos
+        # Deposit slug odor based on size/nutrition, together with the prey
+        # deposits queued last tick, in a single scatter-add
+        slugs = self.cyberslugs
+        positions = [slug.pos for slug in slugs]
+        odors = np.zeros((len(slugs), self.num_odor_types), dtype=self.patches.dtype)
+        if slugs:
             if self.odor_null:
                 # In odor-null mode, slugs emit minimal odor
-                self.set_patch_odor(x, y, [0, 0, 0, 0, 0.01])
+                odors[:, 4] = 0.01
             else:
                 # Normal: emit odor proportional to size
-                odor_amount = slug.size / self.max_slug_size
-                self.set_patch_odor(x, y, [odor_amount, 0, 0, 0, odor_amount])
+                sizes = np.fromiter((slug.size for slug in slugs), dtype=np.float64, count=len(slugs))
+                odors[:, 0] = odors[:, 4] = sizes / self.max_slug_size
+
+        if self._queued_pos:
+            positions += self._queued_pos
+            odors = np.concatenate((odors, np.array(self._queued_odor, dtype=self.patches.dtype)))
+            self._queued_pos = []
+            self._queued_odor = []
+
+        if positions:
+            pxs, pys = self.convert_to_patch_indices(np.array(positions, dtype=np.float64))
+            # np.add.at accumulates correctly when deposits share a patch
+            np.add.at(self.patches.transpose(1, 2, 0), (pxs, pys), odors)
+
+        # Diffusion and evaporation. A channel nothing has been deposited
+        # into (e.g. drug) is all zero and stays so, so only channels with a
+        # positive max (odor is never negative) go through the stencil
+        peaks = self.patches.reshape(self.num_odor_types, -1).max(axis=1)
+        live = np.flatnonzero(peaks > 0)
+        for c in np.flatnonzero(peaks <= 0):
+            self._patches_next[c].fill(0)
+
+        if _diffuse is not None:
+            # Reads come from one buffer, writes go to the other; swap after
+            _diffuse(self.patches, self._patches_next, self._self_coef, self._nbr_coef, live)
+            self.patches, self._patches_next = self._patches_next, self.patches
+        else:
+            self._diffuse_numpy(live)
+
+    def _diffuse_numpy(self, channels):
+        """Diffuse and evaporate odors with NumPy slicing (no Numba available)"""
+        # One channel at a time so each plane stays cache-resident. The 3x3
+        # box sum is built separably (rows, then columns) with the wrap
+        # handled on the edge strips, so no padded copy is needed.
+        for i in channels:
+            field = self.patches[i]
+            box = self._patches_next[i]
+            rows = self._scratch[i]
 
-        # Diffusion and evaporation
-        # NetLogo: hermi, flab, betaine diffuse at 1.0, pleur at 0.5
-        diffusion_rates = [1.0, 1.0, 1.0, 1.0, 0.5]  # [betaine, hermi, flab, drug, pleur]
-        evap = 0.95  # NetLogo evaporation rate
+            # Horizontal 3-sum with wrap-around
+            np.add(field[:, :-2], field[:, 1:-1], out=rows[:, 1:-1])
+            np.add(rows[:, 1:-1], field[:, 2:], out=rows[:, 1:-1])
+            rows[:, 0] = field[:, -1] + field[:, 0] + field[:, 1]
+            rows[:, -1] = field[:, -2] + field[:, -1] + field[:, 0]
 
-        for i in range(self.num_odor_types):
-            # Diffuse
-            amount = diffusion_rates[i]
-            field = self.patches[i]
-            padded = np.pad(field, 1, mode='wrap')
+            # Vertical 3-sum of the row sums -> full 3x3 box sum
+            np.add(rows[:-2], rows[1:-1], out=box[1:-1])
+            np.add(box[1:-1], rows[2:], out=box[1:-1])
+            box[0] = rows[-1] + rows[0] + rows[1]
+            box[-1] = rows[-2] + rows[-1] + rows[0]
 
-            neighbors_sum = (
-                padded[:-2, :-2] + padded[:-2, 1:-1] + padded[:-2, 2:] +
-                padded[1:-1, :-2]                     + padded[1:-1, 2:] +
-                padded[2:, :-2]  + padded[2:, 1:-1]  + padded[2:, 2:]
-            )
+            # Neighbors are the box minus the center cell:
+            # next = self_coef * field + nbr_coef * (box - field)
+            np.multiply(box, self._nbr_coef[i], out=box)
+            np.multiply(field, self._self_coef[i] - self._nbr_coef[i], out=rows)
+            np.add(box, rows, out=box)
 
-            self.patches[i] = evap * ((1.0 - amount) * field + (amount / 8.0) * neighbors_sum)
+        self.patches, self._patches_next = self._patches_next, self.patches
 
     def convert_to_patch_coords(self, x, y):
         """Convert world coordinates to patch grid coordinates"""
-        px = int((x - self.width / 2) * self.scale + self.patch_width / 2)
-        py = int((y - self.height / 2) * self.scale + self.patch_height / 2)
-        px = max(0, min(self.patch_width - 1, px))
-        py = max(0, min(self.patch_height - 1, py))
+        px = int(x * self.scale + self._px_offset)
+        py = int(y * self.scale + self._py_offset)
+        # Positions are almost always inside the grid; only clamp when not
+        if not 0 <= px <= self._pw_max:
+            px = max(0, min(self._pw_max, px))
+        if not 0 <= py <= self._ph_max:
+            py = max(0, min(self._ph_max, py))
         return px, py
 
+    def convert_to_patch_indices(self, positions):
+        """Convert an (n, 2) array of world coordinates to patch index arrays"""
+        # astype truncates toward zero like int(), so this matches
+        # convert_to_patch_coords point for point
+        pxs = (positions[:, 0] * self.scale + self._px_offset).astype(np.intp)
+        pys = (positions[:, 1] * self.scale + self._py_offset).astype(np.intp)
+        np.clip(pxs, 0, self._pw_max, out=pxs)
+        np.clip(pys, 0, self._ph_max, out=pys)
+        return pxs, pys
+
+    def queue_patch_odor(self, x, y, odorlist):
+        """Queue an odor deposit; it is applied at the start of the next tick"""
+        self._queued_pos.append((x, y))
+        self._queued_odor.append(odorlist)
+
     def set_patch_odor(self, x, y, odorlist):
         """Deposit odor at a given location"""
         px, py = self.convert_to_patch_coords(x, y)
         self.patches[:, px, py] += odorlist
 
     def get_odor_at_position(self, x, y):
-        """Get odor values at a specific position"""
+        """Get odor values (float32 copy) at a specific position"""
         px, py = self.convert_to_patch_coords(x, y)
         return self.patches[:, px, py].copy()
 
+    def get_sensor_odor_sums(self, x, y, heading, size, angles, dists, weights):
+        """
+        Weighted float32 odor sums of sensors placed `angles` degrees off
+        `heading` and `dists` body sizes out from (x, y). Even-numbered
+        sensors are summed into row 0 (left), odd ones into row 1 (right).
+        """
+        if _sense_odors is not None:
+            return _sense_odors(self.patches, x, y, heading, size, angles, dists, weights,
+                                self.scale, self._px_offset, self._py_offset,
+                                self._pw_max, self._ph_max)
+
+        sums = np.zeros((2, self.patches.shape[0]), dtype=np.float32)
+        for k, (offset, dist, weight) in enumerate(zip(angles.tolist(), dists.tolist(),
+                                                        weights.tolist())):
+            a = math.radians(heading + offset)
+            sums[k % 2] += weight * self.get_odor_at_position(x + (dist * size) * math.cos(a),
+                                                              y + (dist * size) * math.sin(a))
+        return sums
+
     def get_sensors(self, x, y, heading):
         """Get sensory input from odor patches based on heading (legacy method)"""
         px, py = self.convert_to_patch_coords(x, y)
 
-        left_x = int(px + self.sensor_distance * math.cos(math.radians(heading - 45)))
-        left_y = int(py + self.sensor_distance * math.sin(math.radians(heading - 45)))
-        right_x = int(px + self.sensor_distance * math.cos(math.radians(heading + 45)))
-        right_y = int(py + self.sensor_distance * math.sin(math.radians(heading + 45)))
+        # cos/sin(heading -+ 45) from a single cos/sin(heading) pair
+        hr = math.radians(heading)
+        ch = math.cos(hr) * self.sensor_distance
+        sh = math.sin(hr) * self.sensor_distance
+
+        left_x = int(px + (ch * _COS45 + sh * _SIN45))
+        left_y = int(py + (sh * _COS45 - ch * _SIN45))
+        right_x = int(px + (ch * _COS45 - sh * _SIN45))
+        right_y = int(py + (sh * _COS45 + ch * _SIN45))
 
         left_x = max(0, min(self.patch_width - 1, left_x))
         left_y = max(0, min(self.patch_height - 1, left_y))
@@ -332,47 +708,63 @@ class CyberSlugModel(Model):
 
     def apply_pain_at_position(self, x, y, amount=20.0):
         """Apply pain stimulus at a position (for poker tool)"""
-        for slug in self.cyberslugs:
+        if not self.cyberslugs:
+            return
+
+        # Let the space's neighbor index pick the candidates; each slug's own
+        # reach (7 * size) is then checked exactly
+        reach = 7 * max(slug.size for slug in self.cyberslugs)
+        for slug in self.space.get_neighbors((x, y), radius=reach, include_center=True):
+            if not isinstance(slug, CyberslugAgent):
+                continue
             sx, sy = slug.pos
-            dist = math.sqrt((sx - x)**2 + (sy - y)**2)
+            dx = sx - x
+            dy = sy - y
+            r = 7 * slug.size
 
-            if dist < 7 * slug.size:  # Within range
+            if dx * dx + dy * dy < r * r:  # Within range
                 # Apply pain to all nociceptors based on distance
-                for noc in slug.nociceptors:
-                    noc_dist = math.sqrt((noc.x - x)**2 + (noc.y - y)**2)
-                    noc.painval += amount / (noc_dist + 0.01)
+                noc_dists = np.hypot(slug._nocx - x, slug._nocy - y)
+                slug._painval += amount / (noc_dists + 0.01)
 
     def set_observed_slug(self, x, y):
         """Set which slug is being observed based on click position"""
-        for slug in self.cyberslugs:
+        if not self.cyberslugs:
+            return False
+
+        # Of the slugs whose reach covers the click, observe the closest one
+        reach = 7 * max(slug.size for slug in self.cyberslugs)
+        best, best_d2 = None, None
+        for slug in self.space.get_neighbors((x, y), radius=reach, include_center=True):
+            if not isinstance(slug, CyberslugAgent):
+                continue
             sx, sy = slug.pos
-            dist = math.sqrt((sx - x)**2 + (sy - y)**2)
-            if dist < 7 * slug.size:
-                self.being_observed = slug
-                self.cyberslug = slug
-                return True
-        return False
+            dx = sx - x
+            dy = sy - y
+            d2 = dx * dx + dy * dy
+            r = 7 * slug.size
+            if d2 < r * r and (best is None or d2 < best_d2):
+                best, best_d2 = slug, d2
+
+        if best is None:
+            return False
+        self.being_observed = best
+        self.cyberslug = best
+        return True
 
     def drag_agent(self, x, y):
         """Move agents to mouse position if close enough (dragger tool)"""
-        from agents import PreyAgent
-
-        # Try to drag prey
-        for agent in self.schedule.agents:
-            if isinstance(agent, PreyAgent):
-                ax, ay = agent.pos
-                dist = math.sqrt((ax - x)**2 + (ay - y)**2)
-                if dist < 3:
-                    self.space.move_agent(agent, (x, y))
-                    return
-
-        # Try to drag slugs
-        for slug in self.cyberslugs:
-            sx, sy = slug.pos
-            dist = math.sqrt((sx - x)**2 + (sy - y)**2)
-            if dist < 3:
-                self.space.move_agent(slug, (x, y))
-                return
+        nearby = self.space.get_neighbors((x, y), radius=3, include_center=True)
+
+        # Prey take priority over slugs
+        for agent_type in (PreyAgent, CyberslugAgent):
+            for agent in nearby:
+                if isinstance(agent, agent_type):
+                    dx = agent.pos[0] - x
+                    dy = agent.pos[1] - y
+                    if dx * dx + dy * dy < 9.0:  # within 3 units
+                        self.space.move_agent(agent, (x, y))
+                        return
 
     def zero_V_hermi(self):
         """Reset Hermissenda learning values (for testing)"""
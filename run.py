@@ -2,11 +2,24 @@
 run.py - Enhanced execution script for CyberSlug simulation
 Now with ALL NetLogo features including advanced learning circuit
 """
+import logging
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter
 from model import CyberSlugModel
-import matplotlib.pyplot as plt
-import pandas as pd
 import numpy as np
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    # pyarrow is optional; pandas' CSV writer is used instead
+    pa = None
+
+# Progress messages; the script shows them at INFO, library callers (and
+# sweep workers) only if they configure logging themselves
+log = logging.getLogger(__name__)
+
 
 def run_simulation(steps=1000,
                    num_slugs=1,
@@ -14,165 +27,215 @@ def run_simulation(steps=1000,
                    flab=15,
                    fauxflab=15,
                    clustering=False,
-                   immobilize=False):
-    """Run a single simulation with all features"""
-    model = CyberSlugModel(
-        num_slugs=num_slugs,
-        hermi_population=hermi,
-        flab_population=flab,
-        fauxflab_population=fauxflab,
-        clustering=clustering,
-        immobilize=immobilize
-    )
+                   immobilize=False,
+                   seed=None,
+                   model=None):
+    """
+    Run a single simulation with all features. Passing an existing `model`
+    resets and reuses it (its own populations and options apply) instead
+    of building a new one.
+    """
+    if model is None:
+        model = CyberSlugModel(
+            num_slugs=num_slugs,
+            hermi_population=hermi,
+            flab_population=flab,
+            fauxflab_population=fauxflab,
+            clustering=clustering,
+            immobilize=immobilize,
+            seed=seed
+        )
+    else:
+        model.reset(seed=seed)
+
+    log.info("Running simulation for %d steps...", steps)
+    log.info("Slugs: %d", model.num_slugs)
+    log.info("Populations - Hermi: %d, Flab: %d, FauxFlab: %d",
+             model.hermi_population, model.flab_population, model.fauxflab_population)
+    log.info("Clustering: %s, Immobilize: %s", model.clustering, model.immobilize)
+
+    # Step in blocks of 100 between progress reports, so the per-tick loop
+    # carries no progress bookkeeping
+    report_every = 100
+    for done in range(report_every, steps + 1, report_every):
+        model.step_many(report_every)
+        log.info("Step %d/%d completed", done, steps)
+    model.step_many(steps % report_every)
+
+    log.info("\nSimulation complete!")
+    return model
 
-    print(f"Running simulation for {steps} steps...")
-    print(f"Slugs: {num_slugs}")
-    print(f"Populations - Hermi: {hermi}, Flab: {flab}, FauxFlab: {fauxflab}")
-    print(f"Clustering: {clustering}, Immobilize: {immobilize}")
 
-    for i in range(steps):
-        model.step()
-        if (i + 1) % 100 == 0:
-            print(f"Step {i + 1}/{steps} completed")
+def _run_one(config):
+    """Run one sweep configuration and return its model-level data"""
+    model = run_simulation(**config)
+    return model.datacollector.get_model_vars_dataframe()
 
-    print("\nSimulation complete!")
-    return model
+
+def sweep(configs, n_workers=None):
+    """
+    Run independent simulations in parallel worker processes.
+    Each config is a dict of run_simulation keyword arguments (give each
+    replicate its own seed); returns one DataFrame per config, in order.
+    """
+    with ProcessPoolExecutor(max_workers=n_workers) as ex:
+        return list(ex.map(_run_one, configs))
+
+
+# plot_results panels, row-major: (title, y label, [(column, legend label, color)])
+_RESULT_PANELS = (
+    ('Prey Encounters', 'Count',
+     [('Total_Hermi_Eaten', 'Hermissenda', 'cyan'),
+      ('Total_Flab_Eaten', 'Flabellina', 'pink'),
+      ('Total_Fauxflab_Eaten', 'Faux-Flab', 'yellow')]),
+    ('Average Appetitive State', 'Appetitive State', [('Avg_AppState', None, 'blue')]),
+    ('Vh_rp (Hermi → Reward+)', 'Association Strength', [('Avg_Vh_rp', None, 'green')]),
+    ('Vf_rn (Flab → Reward-)', 'Association Strength', [('Avg_Vf_rn', None, 'red')]),
+    ('Average Nutrition', 'Nutrition Level', [('Avg_Nutrition', None, 'orange')]),
+    ('Total Bites (Social Interactions)', 'Bite Count', [('Total_Bites', None, 'red')]),
+)
 
 
 def plot_results(model):
     """Plot comprehensive simulation results"""
+    # Imported here so runs that never plot skip pyplot's backend and
+    # font-cache start-up
+    import matplotlib.pyplot as plt
+
     data = model.datacollector.get_model_vars_dataframe()
+    steps = data.index.to_numpy()
 
-    fig, axes = plt.subplots(3, 2, figsize=(15, 15))
+    fig, axes = plt.subplots(3, 2, figsize=(15, 15), sharex=True)
     fig.suptitle('CyberSlug Complete Simulation Results', fontsize=16, fontweight='bold')
 
-    # Plot 1: Prey encounters over time
-    axes[0, 0].plot(data.index, data['Total_Hermi_Eaten'], label='Hermissenda',
-                   color='cyan', linewidth=2)
-    axes[0, 0].plot(data.index, data['Total_Flab_Eaten'], label='Flabellina',
-                   color='pink', linewidth=2)
-    axes[0, 0].plot(data.index, data['Total_Fauxflab_Eaten'], label='Faux-Flab',
-                   color='yellow', linewidth=2)
-    axes[0, 0].set_xlabel('Time Steps')
-    axes[0, 0].set_ylabel('Count')
-    axes[0, 0].set_title('Prey Encounters')
-    axes[0, 0].legend()
-    axes[0, 0].grid(True, alpha=0.3)
-
-    # Plot 2: Appetitive state over time
-    axes[0, 1].plot(data.index, data['Avg_AppState'], color='blue', linewidth=2)
-    axes[0, 1].set_xlabel('Time Steps')
-    axes[0, 1].set_ylabel('Appetitive State')
-    axes[0, 1].set_title('Average Appetitive State')
-    axes[0, 1].grid(True, alpha=0.3)
-
-    # Plot 3: Learning values - Vh_rp (Hermi positive reward)
-    axes[1, 0].plot(data.index, data['Avg_Vh_rp'], color='green', linewidth=2)
-    axes[1, 0].set_xlabel('Time Steps')
-    axes[1, 0].set_ylabel('Association Strength')
-    axes[1, 0].set_title('Vh_rp (Hermi → Reward+)')
-    axes[1, 0].grid(True, alpha=0.3)
-
-    # Plot 4: Learning values - Vf_rn (Flab negative reward)
-    axes[1, 1].plot(data.index, data['Avg_Vf_rn'], color='red', linewidth=2)
-    axes[1, 1].set_xlabel('Time Steps')
-    axes[1, 1].set_ylabel('Association Strength')
-    axes[1, 1].set_title('Vf_rn (Flab → Reward-)')
-    axes[1, 1].grid(True, alpha=0.3)
-
-    # Plot 5: Nutrition over time
-    axes[2, 0].plot(data.index, data['Avg_Nutrition'], color='orange', linewidth=2)
-    axes[2, 0].set_xlabel('Time Steps')
-    axes[2, 0].set_ylabel('Nutrition Level')
-    axes[2, 0].set_title('Average Nutrition')
-    axes[2, 0].grid(True, alpha=0.3)
-
-    # Plot 6: Social interactions (bites)
-    axes[2, 1].plot(data.index, data['Total_Bites'], color='red', linewidth=2)
-    axes[2, 1].set_xlabel('Time Steps')
-    axes[2, 1].set_ylabel('Bite Count')
-    axes[2, 1].set_title('Total Bites (Social Interactions)')
-    axes[2, 1].grid(True, alpha=0.3)
-
-    plt.tight_layout()
-    plt.savefig('cyberslug_complete_results.png', dpi=300, bbox_inches='tight')
+    for ax, (title, ylabel, series) in zip(axes.flat, _RESULT_PANELS):
+        for column, label, color in series:
+            ax.plot(steps, data[column].to_numpy(), label=label, color=color, linewidth=2)
+        ax.set_xlabel('Time Steps')
+        ax.set_ylabel(ylabel)
+        ax.set_title(title)
+        if len(series) > 1:
+            ax.legend()
+        ax.grid(True, alpha=0.3)
+
+    # tight_layout already fits the panels to the canvas, so skip the extra
+    # bbox_inches='tight' render pass; line plots don't need 300 dpi
+    fig.tight_layout()
+    fig.savefig('cyberslug_complete_results.png', dpi=100)
     print("\nPlots saved to 'cyberslug_complete_results.png'")
     plt.show()
 
     return data
 
 
+# Every attribute the per-slug section of print_summary reports, fetched
+# in one call per slug and named as in _SLUG_TEMPLATE
+_SLUG_FIELDS = (
+    'size', 'nutrition', 'satiation', 'app_state',
+    'hermi_counter', 'flab_counter', 'fauxflab_counter', 'bite_counter', '被咬_counter',
+    'Vh_rp', 'Vh_rp0', 'Vh_rn', 'Vh_rn0', 'Vf_rp', 'Vf_rp0', 'Vf_rn', 'Vf_rn0', 'Vh_n', 'Vf_n',
+    'Wh_rp', 'Wf_rn', 'R_pos', 'R_neg', 'NR', 'M', 'M0', 'W3')
+_slug_details = attrgetter(*_SLUG_FIELDS)
+
+_SLUG_TEMPLATE = """
+🐌 Slug {i}:
+  Size: {size:.2f}
+  Nutrition: {nutrition:.3f}
+  Satiation: {satiation:.3f}
+  Appetitive State: {app_state:.3f}
+
+  Prey Consumed:
+    Hermissenda: {hermi_counter}
+    Flabellina: {flab_counter}
+    Faux-Flabellina: {fauxflab_counter}
+
+  Social Interactions:
+    Bites Given: {bite_counter}
+    Times Bitten: {被咬_counter}
+
+  Learning Circuit (Association Strengths):
+    Vh_rp (Hermi→R+): {Vh_rp:.3f} (baseline: {Vh_rp0:.3f})
+    Vh_rn (Hermi→R-): {Vh_rn:.3f} (baseline: {Vh_rn0:.3f})
+    Vf_rp (Flab→R+):  {Vf_rp:.3f} (baseline: {Vf_rp0:.3f})
+    Vf_rn (Flab→R-):  {Vf_rn:.3f} (baseline: {Vf_rn0:.3f})
+    Vh_n (Hermi→NR):  {Vh_n:.3f}
+    Vf_n (Flab→NR):   {Vf_n:.3f}
+
+  Synaptic Weights:
+    Wh_rp: {Wh_rp:.3f}
+    Wf_rn: {Wf_rn:.3f}
+
+  Reward Neurons:
+    R+: {R_pos:.3f}
+    R-: {R_neg:.3f}
+    NR: {NR:.3f}
+
+  Habituation Circuit:
+    M (processed odor): {M:.3f}
+    M0 (baseline): {M0:.3f}
+    W3 (synaptic weight): {W3:.3f}"""
+
+
+def save_csv(data, path):
+    """Write the collected data to CSV, with Arrow's C writer when available"""
+    if pa is None:
+        data.to_csv(path)
+        return
+    # Index first as an unnamed column, like DataFrame.to_csv. The text is not
+    # identical (Arrow quotes the header and writes 0.0 as 0), but the values are
+    table = pa.Table.from_pandas(data.reset_index(names=''), preserve_index=False)
+    pacsv.write_csv(table, path)
+
+
 def print_summary(model):
     """Print comprehensive summary statistics"""
-    print("\n" + "=" * 70)
-    print("CYBERSLUG SIMULATION SUMMARY")
-    print("=" * 70)
-    print(f"Total Steps: {model.ticks}")
-    print(f"Number of Slugs: {len(model.cyberslugs)}")
+    # Gather every line and hand them to stdout in a single write
+    lines = []
+    out = lines.append
+
+    out("\n" + "=" * 70)
+    out("CYBERSLUG SIMULATION SUMMARY")
+    out("=" * 70)
+    out(f"Total Steps: {model.ticks}")
+    out(f"Number of Slugs: {len(model.cyberslugs)}")
 
-    print("\n" + "-" * 70)
-    print("GLOBAL STATISTICS")
-    print("-" * 70)
+    out("\n" + "-" * 70)
+    out("GLOBAL STATISTICS")
+    out("-" * 70)
 
-    total_hermi = sum(s.hermi_counter for s in model.cyberslugs)
-    total_flab = sum(s.flab_counter for s in model.cyberslugs)
-    total_fauxflab = sum(s.fauxflab_counter for s in model.cyberslugs)
-    total_bites = sum(s.bite_counter for s in model.cyberslugs)
+    stats = model.get_stats_arrays()
+    total_hermi = int(stats['hermi'].sum())
+    total_flab = int(stats['flab'].sum())
+    total_fauxflab = int(stats['fauxflab'].sum())
+    total_bites = int(stats['bites'].sum())
 
-    print(f"Total Hermissenda eaten: {total_hermi}")
-    print(f"Total Flabellina eaten: {total_flab}")
-    print(f"Total Faux-Flabellina eaten: {total_fauxflab}")
-    print(f"Total Bites: {total_bites}")
+    out(f"Total Hermissenda eaten: {total_hermi}")
+    out(f"Total Flabellina eaten: {total_flab}")
+    out(f"Total Faux-Flabellina eaten: {total_fauxflab}")
+    out(f"Total Bites: {total_bites}")
 
-    avg_nutrition = np.mean([s.nutrition for s in model.cyberslugs])
-    avg_size = np.mean([s.size for s in model.cyberslugs])
+    avg_nutrition = stats['nutrition'].mean()
+    avg_size = stats['size'].mean()
 
-    print(f"\nAverage Nutrition: {avg_nutrition:.3f}")
-    print(f"Average Size: {avg_size:.3f}")
+    out(f"\nAverage Nutrition: {avg_nutrition:.3f}")
+    out(f"Average Size: {avg_size:.3f}")
 
-    print("\n" + "-" * 70)
-    print("PER-SLUG DETAILS")
-    print("-" * 70)
+    out("\n" + "-" * 70)
+    out("PER-SLUG DETAILS")
+    out("-" * 70)
 
     for i, slug in enumerate(model.cyberslugs):
-        print(f"\n🐌 Slug {i}:")
-        print(f"  Size: {slug.size:.2f}")
-        print(f"  Nutrition: {slug.nutrition:.3f}")
-        print(f"  Satiation: {slug.satiation:.3f}")
-        print(f"  Appetitive State: {slug.app_state:.3f}")
-
-        print(f"\n  Prey Consumed:")
-        print(f"    Hermissenda: {slug.hermi_counter}")
-        print(f"    Flabellina: {slug.flab_counter}")
-        print(f"    Faux-Flabellina: {slug.fauxflab_counter}")
-
-        print(f"\n  Social Interactions:")
-        print(f"    Bites Given: {slug.bite_counter}")
-        print(f"    Times Bitten: {slug.被咬_counter}")
-
-        print(f"\n  Learning Circuit (Association Strengths):")
-        print(f"    Vh_rp (Hermi→R+): {slug.Vh_rp:.3f} (baseline: {slug.Vh_rp0:.3f})")
-        print(f"    Vh_rn (Hermi→R-): {slug.Vh_rn:.3f} (baseline: {slug.Vh_rn0:.3f})")
-        print(f"    Vf_rp (Flab→R+):  {slug.Vf_rp:.3f} (baseline: {slug.Vf_rp0:.3f})")
-        print(f"    Vf_rn (Flab→R-):  {slug.Vf_rn:.3f} (baseline: {slug.Vf_rn0:.3f})")
-        print(f"    Vh_n (Hermi→NR):  {slug.Vh_n:.3f}")
-        print(f"    Vf_n (Flab→NR):   {slug.Vf_n:.3f}")
-
-        print(f"\n  Synaptic Weights:")
-        print(f"    Wh_rp: {slug.Wh_rp:.3f}")
-        print(f"    Wf_rn: {slug.Wf_rn:.3f}")
-
-        print(f"\n  Reward Neurons:")
-        print(f"    R+: {slug.R_pos:.3f}")
-        print(f"    R-: {slug.R_neg:.3f}")
-        print(f"    NR: {slug.NR:.3f}")
-
-        print(f"\n  Habituation Circuit:")
-        print(f"    M (processed odor): {slug.M:.3f}")
-        print(f"    M0 (baseline): {slug.M0:.3f}")
-        print(f"    W3 (synaptic weight): {slug.W3:.3f}")
+        fields = dict(zip(_SLUG_FIELDS, _slug_details(slug)), i=i)
+        out(_SLUG_TEMPLATE.format_map(fields))
 
-    print("\n" + "=" * 70)
+    out("\n" + "=" * 70)
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+# Snapshot layout for run_learning_experiment
+_LEARNING_DTYPE = np.dtype([
+    ('step', 'i4'), ('Vh_rp', 'f4'), ('Vh_rp0', 'f4'), ('Wh_rp', 'f4'),
+    ('hermi_eaten', 'i4'), ('R_pos', 'f4'), ('CS1', 'f4')])
 
 
 def run_learning_experiment():
@@ -194,28 +257,26 @@ def run_learning_experiment():
 
     # Track learning over time
     steps_to_track = [0, 100, 500, 1000, 2000]
-    learning_data = []
-
-    for step in range(max(steps_to_track) + 1):
-        model.step()
-
-        if step in steps_to_track:
-            learning_data.append({
-                'step': step,
-                'Vh_rp': slug.Vh_rp,
-                'Vh_rp0': slug.Vh_rp0,
-                'Wh_rp': slug.Wh_rp,
-                'hermi_eaten': slug.hermi_counter,
-                'R_pos': slug.R_pos,
-                'CS1': slug.CS1
-            })
-
-            print(f"\nStep {step}:")
-            print(f"  Hermissenda eaten: {slug.hermi_counter}")
-            print(f"  Vh_rp: {slug.Vh_rp:.4f} (baseline: {slug.Vh_rp0:.4f})")
-            print(f"  Wh_rp: {slug.Wh_rp:.4f}")
-            print(f"  R+ activity: {slug.R_pos:.4f}")
-            print(f"  CS1 (hermi trace): {slug.CS1:.4f}")
+    # One record per tracked step; the learning values are bounded, so
+    # float32 holds them comfortably
+    learning_data = np.empty(len(steps_to_track), dtype=_LEARNING_DTYPE)
+
+    # Step straight through to each tracked point (the snapshot labelled
+    # `step` is taken after step + 1 model steps)
+    prev = -1
+    for k, step in enumerate(sorted(steps_to_track)):
+        model.step_many(step - prev)
+        prev = step
+
+        learning_data[k] = (step, slug.Vh_rp, slug.Vh_rp0, slug.Wh_rp,
+                            slug.hermi_counter, slug.R_pos, slug.CS1)
+
+        print(f"\nStep {step}:")
+        print(f"  Hermissenda eaten: {slug.hermi_counter}")
+        print(f"  Vh_rp: {slug.Vh_rp:.4f} (baseline: {slug.Vh_rp0:.4f})")
+        print(f"  Wh_rp: {slug.Wh_rp:.4f}")
+        print(f"  R+ activity: {slug.R_pos:.4f}")
+        print(f"  CS1 (hermi trace): {slug.CS1:.4f}")
 
     print("\n" + "=" * 70)
     print("Learning complete! Slug should show increased Vh_rp and Wh_rp values.")
@@ -225,16 +286,31 @@ def run_learning_experiment():
 
 
 if __name__ == "__main__":
-    import sys
-
-    if len(sys.argv) > 1 and sys.argv[1] == "--learning":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the CyberSlug simulation")
+    parser.add_argument("--learning", action="store_true",
+                        help="run the learning experiment instead")
+    parser.add_argument("--steps", type=int, default=2000)
+    parser.add_argument("--slugs", type=int, default=2)
+    parser.add_argument("--no-plot", action="store_true",
+                        help="skip plotting (for timing the model itself)")
+    parser.add_argument("--no-csv", action="store_true",
+                        help="skip writing the CSV")
+    args = parser.parse_args()
+
+    # Show this script's progress without Mesa's own INFO-level step logging
+    logging.basicConfig(format="%(message)s")
+    log.setLevel(logging.INFO)
+
+    if args.learning:
         # Run learning experiment
         learning_data = run_learning_experiment()
     else:
         # Run standard simulation
         model = run_simulation(
-            steps=2000,
-            num_slugs=2,
+            steps=args.steps,
+            num_slugs=args.slugs,
             hermi=15,
             flab=15,
             fauxflab=15,
@@ -245,11 +321,15 @@ if __name__ == "__main__":
         print_summary(model)
 
         # Plot results
-        data = plot_results(model)
+        if args.no_plot:
+            data = model.datacollector.get_model_vars_dataframe()
+        else:
+            data = plot_results(model)
 
         # Save data to CSV
-        data.to_csv('cyberslug_complete_data.csv')
-        print("\nData saved to 'cyberslug_complete_data.csv'")
+        if not args.no_csv:
+            save_csv(data, 'cyberslug_complete_data.csv')
+            print("\nData saved to 'cyberslug_complete_data.csv'")
 
         print("\n💡 TIP: Run with '--learning' flag to see learning experiment:")
-        print("   python run.py --learning")
\ No newline at end of file
+        print("   python run.py --learning")
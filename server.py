@@ -7,19 +7,215 @@ server.py - CyberSlug visualization with ALL NetLogo features
 - Proboscis visualization
 - All NetLogo switches and controls
 """
+import asyncio
+import time
 import solara
-from model import CyberSlugModel
-import matplotlib.pyplot as plt
+import solara.lab
+from model import CyberSlugModel, PREY_SPECIES
+from agents import PreyAgent
 from matplotlib.figure import Figure
 import matplotlib.patches as mpatches
 import matplotlib.lines as mlines
-import math
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba_array
+import numpy as np
+
+# Shortest time between two auto-run redraws (about 15 frames a second)
+_MIN_FRAME_INTERVAL = 1 / 15
+
+# Path simplification tolerance for slug trails, in pixels (Matplotlib's
+# default is 1/9)
+_TRAIL_SIMPLIFY_THRESHOLD = 1.0
+
+# Slug i is drawn in color i % 6; body outlines are black, gold when
+# observed and red while biting (with the matching line widths)
+_SLUG_RGBA = to_rgba_array(['brown', 'darkred', 'darkgreen', 'darkblue', 'purple', 'orange'])
+_EDGE_RGBA = to_rgba_array(['black', 'gold', 'red'])
+_EDGE_WIDTHS = np.array([2.0, 4.0, 5.0])
+
+# Prey type -> row of the color table (last row for unknown types)
+_PREY_TYPE_INDEX = {'hermi': 0, 'flab': 1, 'fauxflab': 2}
+_PREY_RGBA = to_rgba_array(['cyan', 'pink', 'yellow', 'gray'])
+_PREY_LEGEND_NAMES = ('Hermissenda', 'Flabellina', 'Faux-Flab')
+
+
+class _Scene:
+    """
+    The main visualization, built once per model: the figure, axes and the
+    artists for paths, prey, slugs, headings, proboscises and nociceptors
+    persist, and update() only moves them to the model's current state.
+    """
+
+    def __init__(self, model):
+        self.fig = Figure(figsize=(12, 12))
+        ax = self.ax = self.fig.add_subplot(111)
+
+        ax.set_xlim(0, model.width)
+        ax.set_ylim(0, model.height)
+        ax.set_aspect('equal')
+        ax.set_facecolor('#f0f0f0')
+        ax.grid(True, alpha=0.2)
+        ax.set_xlabel('X Position')
+        ax.set_ylabel('Y Position')
+        self.title = ax.set_title('', fontsize=16, fontweight='bold')
+
+        n = len(model.cyberslugs)
+        slug_colors = _SLUG_RGBA[np.arange(n) % len(_SLUG_RGBA)]
+
+        # Slug paths, one polyline per slug in a single collection
+        self.paths = ax.add_collection(
+            LineCollection([], colors=slug_colors, linewidths=1, alpha=0.3,
+                           antialiased=False))
+
+        # Cluster centers, shown only while clustering is enabled
+        self.clusters = [
+            ax.scatter([0], [0], s=500, c=color, marker='x', linewidth=3,
+                       alpha=0.5, label=label)
+            for color, label in (('cyan', 'Hermi Cluster'), ('pink', 'Flab Cluster'),
+                                 ('yellow', 'Fauxflab Cluster'))]
+
+        # All prey in one collection
+        self.prey = ax.scatter(np.empty(0), np.empty(0), s=100, edgecolors='black',
+                               linewidth=1, zorder=3, alpha=0.7)
+
+        # Slug bodies and heading arrows, one entry per slug
+        origin = np.zeros(n)
+        self.slugs = ax.scatter(origin, origin, c=slug_colors, marker='o', zorder=5, alpha=0.8)
+        self.headings = ax.quiver(origin, origin, origin, origin, color=slug_colors,
+                                  angles='xy', scale_units='xy', scale=1,
+                                  units='xy', width=1.0, headwidth=8, headlength=6,
+                                  headaxislength=5.5, zorder=6, alpha=0.6)
+
+        # Extended proboscises: a segment and a tip marker per extended slug
+        self.proboscis = ax.add_collection(
+            LineCollection([], colors='red', linewidths=3, alpha=0.8, zorder=6))
+        self.proboscis_tips = ax.scatter(np.empty(0), np.empty(0), c='red', s=50, zorder=6)
+
+        # Slug ID labels, and a bite line and mark per slug shown while it bites
+        self.labels = [ax.text(0, 0, str(i), fontsize=12, fontweight='bold', ha='center',
+                               va='center', color='white', zorder=6) for i in range(n)]
+        self.bite_lines = ax.add_collection(
+            LineCollection([], colors='red', linewidths=4, alpha=0.7, zorder=4))
+        self.bite_marks = [ax.text(0, 0, '💥', fontsize=24, ha='center', va='center',
+                                   zorder=7, visible=False) for _ in range(n)]
+
+        # Nociceptors in pain (shown when enabled), colored per point
+        self.nociceptors = ax.scatter(np.empty(0), np.empty(0), s=80, edgecolors='black',
+                                      linewidth=1, zorder=7, alpha=0.8)
+
+        # Legend entries, built once; update() fills in the prey counts
+        self._prey_handles = [mpatches.Patch(color=color, label=name) for color, name in
+                              zip(('cyan', 'pink', 'yellow'), _PREY_LEGEND_NAMES)]
+        self._bite_handle = mlines.Line2D([], [], color='red', linewidth=4,
+                                          label='Biting!', marker='o', markersize=10)
+        self._legend_biting = None
+        self._legend_texts = []
+
+    def update(self, model, show_nociceptors):
+        """Move every artist to the model's current state; returns the figure"""
+        ax = self.ax
+        self.title.set_text(f'CyberSlug Complete Simulation - Step {model.steps}')
+
+        # Slug paths (kept one per slug, even when empty, so colors line up)
+        # Copied: points is a view into the ring buffer, which later appends overwrite
+        self.paths.set_segments([slug.path.points.copy() for slug in model.cyberslugs])
+        # A pixel of deviation is invisible on the faint trails
+        for path in self.paths.get_paths():
+            path.simplify_threshold = _TRAIL_SIMPLIFY_THRESHOLD
+
+        # Cluster centers
+        for marker, (x, y) in zip(self.clusters, model.cluster_centers.tolist()):
+            marker.set_visible(model.clustering)
+            marker.set_offsets([(x, y)])
+
+        # Prey: positions and color-table rows gathered straight into arrays
+        prey = model.prey_agents
+        n_prey = len(prey)
+        self.prey.set_offsets(np.fromiter((agent.pos for agent in prey),
+                                          dtype=(float, 2), count=n_prey))
+        type_idx = np.fromiter((_PREY_TYPE_INDEX.get(agent.prey_type, 3) for agent in prey),
+                               dtype=np.intp, count=n_prey)
+        self.prey.set_facecolors(_PREY_RGBA[type_idx])
+
+        # Slugs: positions, sizes and unit headings for all of them at once
+        slugs = model.cyberslugs
+        n = len(slugs)
+        xy = np.fromiter((slug.pos for slug in slugs), dtype=(float, 2), count=n)
+        size = np.fromiter((slug.size for slug in slugs), dtype=float, count=n)
+        angle = np.radians(np.fromiter((slug.angle for slug in slugs), dtype=float, count=n))
+        direction = np.column_stack((np.cos(angle), np.sin(angle)))
+
+        self.slugs.set_offsets(xy)
+        self.slugs.set_sizes(400 + size * 40)
+
+        # Heading indicators (ax.arrow drew its 6-unit head past the tip;
+        # quiver arrows include the head)
+        heading = direction * (20 + size + 6)[:, None]
+        self.headings.set_offsets(xy)
+        self.headings.set_UVC(heading[:, 0], heading[:, 1])
+
+        # Proboscis, for the slugs that have it extended
+        extended = np.fromiter((slug.proboscis_extended for slug in slugs), dtype=bool, count=n)
+        phase = np.fromiter((slug.proboscis_phase for slug in slugs), dtype=float, count=n)
+        tips = xy + direction * (0.15 * size + 0.1 * phase)[:, None]
+        self.proboscis.set_segments(np.stack((xy, tips), axis=1)[extended])
+        self.proboscis_tips.set_offsets(tips[extended])
+
+        # Highlight based on state: biting wins over being observed
+        biting = np.fromiter((slug.is_biting for slug in slugs), dtype=bool, count=n)
+        observed = np.fromiter((slug is model.being_observed for slug in slugs),
+                               dtype=bool, count=n)
+        edge = np.where(biting, 2, observed.astype(np.intp))
+        self.slugs.set_edgecolors(_EDGE_RGBA[edge])
+        self.slugs.set_linewidths(_EDGE_WIDTHS[edge])
+
+        bites = []
+        for slug, label, mark in zip(slugs, self.labels, self.bite_marks):
+            slug_x, slug_y = slug.pos
+            label.set_position((slug_x, slug_y))
+
+            # Show bite indicator
+            target = slug.bite_target if slug.is_biting else None
+            if target:
+                tx, ty = target.pos
+                bites.append(((slug_x, slug_y), (tx, ty)))
+                mark.set_position(((slug_x + tx)/2, (slug_y + ty)/2))
+            mark.set_visible(bool(target))
+        self.bite_lines.set_segments(bites)
+
+        # Nociceptors of every slug in one collection: those feeling any
+        # pain, shaded from white to red by intensity
+        if show_nociceptors:
+            nocs = (np.concatenate([slug.nociceptor_points for slug in slugs])
+                    if slugs else np.empty((0, 3)))
+            nocs = nocs[nocs[:, 2] > 0.000001]
+        else:
+            nocs = np.empty((0, 3))
+        pain_intensity = np.minimum(1.0, nocs[:, 2] / 5.0)
+        self.nociceptors.set_offsets(nocs[:, :2])
+        self.nociceptors.set_facecolors(np.column_stack(
+            (np.ones_like(pain_intensity), 1.0 - pain_intensity, 1.0 - pain_intensity)))
+
+        # Legend: rebuilt only when the biting entry comes or goes; otherwise
+        # just the prey counts in its labels change
+        if model.biting != self._legend_biting:
+            handles = self._prey_handles + ([self._bite_handle] if model.biting else [])
+            self._legend_texts = ax.legend(handles=handles, loc='upper right',
+                                           fontsize=10).get_texts()
+            self._legend_biting = model.biting
+        for text, name, prey_type in zip(self._legend_texts, _PREY_LEGEND_NAMES,
+                                         ('hermi', 'flab', 'fauxflab')):
+            text.set_text(f'{name} ({len(model.prey_by_type[prey_type])})')
+
+        return self.fig
 
 
 @solara.component
 def Page():
-    # Model state
-    model, set_model = solara.use_state(CyberSlugModel())
+    # Model state; the initial model is built once (use_state's argument
+    # would otherwise be a fresh model on every render)
+    initial_model = solara.use_memo(CyberSlugModel, dependencies=[])
+    model, set_model = solara.use_state(initial_model)
 
     # Population parameters
     num_slugs = solara.use_reactive(2)
@@ -35,10 +231,9 @@ def Page():
     odor_null = solara.use_reactive(False)
     show_nociceptors = solara.use_reactive(False)
 
-    # Interactive tool modes (only one can be active)
-    dragger_mode = solara.use_reactive(False)
-    poker_mode = solara.use_reactive(False)
-    observer_mode = solara.use_reactive(False)
+    # Interactive tool mode: 'none', 'dragger', 'poker' or 'observer' (a
+    # single value, so switching tools is one state write)
+    tool_mode = solara.use_reactive('none')
 
     # Satiation override
     fix_satiation = solara.use_reactive(False)
@@ -58,28 +253,46 @@ def Page():
     # Mouse state for interactions
     mouse_state = solara.use_reactive({"x": 0, "y": 0, "down": False})
 
+    def apply_settings():
+        """Copy the toggle values onto the model (once per batch of steps)"""
+        model.clustering = clustering.value
+        model.immobilize = immobilize.value
+        model.biting = biting.value
+        model.odor_null = odor_null.value
+        model.fix_satiation_override = fix_satiation.value
+        model.fix_satiation_value = satiation_value.value
+
     # Auto-run effect
+    last_render = solara.use_ref(0.0)
+
     def auto_step():
         if auto_running.value:
             update_populations_realtime()
             # Run multiple steps
-            for _ in range(steps_per_frame.value):
-                model.clustering = clustering.value
-                model.immobilize = immobilize.value
-                model.biting = biting.value
-                model.odor_null = odor_null.value
-                model.fix_satiation_override = fix_satiation.value
-                model.fix_satiation_value = satiation_value.value
-                model.step()
-            set_render_key(render_key + 1)
-
-    # Set up auto-run timer
-    solara.use_thread(
-        lambda: __import__('time').sleep(update_interval.value) or auto_step() if auto_running.value else None,
-        dependencies=[auto_running.value, render_key]
-    )
+            apply_settings()
+            model.step_many(steps_per_frame.value)
+            # Matplotlib can't draw much faster than ~15 frames a second, so
+            # keep stepping at the requested rate but redraw at most that
+            # often. The auto-run task outlives renders, so bump the key from
+            # its current value rather than the one this closure saw
+            now = time.monotonic()
+            if now - last_render.current >= _MIN_FRAME_INTERVAL:
+                last_render.current = now
+                set_render_key(lambda key: key + 1)
+
+    # Auto-run timer: one long-lived task per run, restarted only when the
+    # run is toggled or the model is replaced (not on every frame)
+    async def auto_run():
+        while auto_running.value:
+            await asyncio.sleep(update_interval.value)
+            auto_step()
+
+    solara.lab.use_task(auto_run, dependencies=[auto_running.value, model])
 
     def toggle_auto_run():
+        if auto_running.value:
+            # Show the last steps even if their frame was skipped
+            set_render_key(lambda key: key + 1)
         auto_running.set(not auto_running.value)
 
     def reset():
@@ -103,95 +316,39 @@ def Page():
     def do_step():
         update_populations_realtime()
         # Update model settings from toggles
-        model.clustering = clustering.value
-        model.immobilize = immobilize.value
-        model.biting = biting.value
-        model.odor_null = odor_null.value
-        model.fix_satiation_override = fix_satiation.value
-        model.fix_satiation_value = satiation_value.value
+        apply_settings()
         model.step()
         set_render_key(render_key + 1)
 
     def do_multiple_steps():
         update_populations_realtime()
-        for _ in range(10):
-            model.clustering = clustering.value
-            model.immobilize = immobilize.value
-            model.biting = biting.value
-            model.odor_null = odor_null.value
-            model.fix_satiation_override = fix_satiation.value
-            model.fix_satiation_value = satiation_value.value
-            model.step()
+        apply_settings()
+        model.step_many(10)
         set_render_key(render_key + 1)
 
     def update_populations_realtime():
         """Dynamically add or remove prey to match slider values"""
-        from agents import PreyAgent
-
-        current_counts = {'hermi': 0, 'flab': 0, 'fauxflab': 0}
-        prey_agents = {'hermi': [], 'flab': [], 'fauxflab': []}
-
-        for agent in list(model.schedule.agents):
-            if isinstance(agent, PreyAgent):
-                current_counts[agent.prey_type] += 1
-                prey_agents[agent.prey_type].append(agent)
-
-        target_counts = {
-            'hermi': hermi_pop.value,
-            'flab': flab_pop.value,
-            'fauxflab': fauxflab_pop.value
-        }
-
-        prey_config = {
-            'hermi': {
-                'color': (0, 255, 255),
-                'odor': [0.5, 0.5, 0, 0, 0],
-                'cluster': (model.hermi_cluster_x, model.hermi_cluster_y)
-            },
-            'flab': {
-                'color': (255, 105, 180),
-                'odor': [0.5, 0, 0.5, 0, 0],
-                'cluster': (model.flab_cluster_x, model.flab_cluster_y)
-            },
-            'fauxflab': {
-                'color': (255, 255, 0),
-                'odor': [0.0, 0.0, 0.5, 0.0, 0],
-                'cluster': (model.fauxflab_cluster_x, model.fauxflab_cluster_y)
-            }
-        }
-
-        for prey_type in ['hermi', 'flab', 'fauxflab']:
-            current = current_counts[prey_type]
-            target = target_counts[prey_type]
+        targets = (hermi_pop.value, flab_pop.value, fauxflab_pop.value)
 
-            if current < target:
-                for _ in range(target - current):
-                    max_id = max([a.unique_id for a in model.schedule.agents]) + 1
-                    new_prey = PreyAgent(
-                        max_id,
-                        model,
-                        prey_type=prey_type,
-                        color=prey_config[prey_type]['color'],
-                        odor=prey_config[prey_type]['odor']
-                    )
-                    new_prey.cluster_target = prey_config[prey_type]['cluster']
-                    model.schedule.add(new_prey)
-
-                    if model.clustering:
-                        cx, cy = prey_config[prey_type]['cluster']
-                        x = cx + model.random.uniform(-model.cluster_radius, model.cluster_radius)
-                        y = cy + model.random.uniform(-model.cluster_radius, model.cluster_radius)
-                    else:
-                        x = model.random.randrange(model.width)
-                        y = model.random.randrange(model.height)
+        for row, ((prey_type, color, odor), target) in enumerate(zip(PREY_SPECIES, targets)):
+            of_type = model.prey_by_type[prey_type]
+            current = len(of_type)
 
-                    model.space.place_agent(new_prey, (x, y))
+            if current < target:
+                # One odor vector and cluster target shared by the new prey,
+                # and all their positions drawn at once
+                odor = np.asarray(odor, dtype=np.float32)
+                cluster = model.cluster_centers[row]
+                cluster_target = tuple(cluster.tolist())
+                for pos in model.sample_positions(target - current, cluster):
+                    new_prey = PreyAgent(model.new_agent_id(), model, prey_type=prey_type,
+                                         color=color, odor=odor)
+                    new_prey.cluster_target = cluster_target
+                    model.add_prey(new_prey, pos)
 
             elif current > target:
-                to_remove = current - target
-                for agent in prey_agents[prey_type][:to_remove]:
-                    model.space.remove_agent(agent)
-                    model.schedule.remove(agent)
+                for agent in of_type[:current - target]:
+                    model.remove_prey(agent)
 
         model.hermi_population = hermi_pop.value
         model.flab_population = flab_pop.value
@@ -207,139 +364,17 @@ def Page():
         model.zero_V_flab()
         set_render_key(render_key + 1)
 
-    def create_plot():
-        """Create main visualization with all features"""
-        fig = Figure(figsize=(12, 12))
-        ax = fig.add_subplot(111)
+    # One persistent figure per model; each render just updates its artists
+    scene = solara.use_memo(lambda: _Scene(model), dependencies=[model])
 
-        ax.set_xlim(0, model.width)
-        ax.set_ylim(0, model.height)
-        ax.set_aspect('equal')
-        ax.set_facecolor('#f0f0f0')
-        ax.set_title(f'CyberSlug Complete Simulation - Step {model.steps}',
-                    fontsize=16, fontweight='bold')
-
-        # Draw slug paths
-        from agents import CyberslugAgent
-        for i, slug in enumerate(model.cyberslugs):
-            if len(slug.path) > 1:
-                path_array = list(slug.path)
-                xs, ys = zip(*path_array)
-                colors = ['brown', 'darkred', 'darkgreen', 'darkblue', 'purple', 'orange']
-                color = colors[i % len(colors)]
-                ax.plot(xs, ys, color=color, linewidth=1, alpha=0.3)
-
-        # Draw cluster centers if clustering is enabled
-        if model.clustering:
-            ax.scatter(model.hermi_cluster_x, model.hermi_cluster_y,
-                      s=500, c='cyan', marker='x', linewidth=3,
-                      alpha=0.5, label='Hermi Cluster')
-            ax.scatter(model.flab_cluster_x, model.flab_cluster_y,
-                      s=500, c='pink', marker='x', linewidth=3,
-                      alpha=0.5, label='Flab Cluster')
-            ax.scatter(model.fauxflab_cluster_x, model.fauxflab_cluster_y,
-                      s=500, c='yellow', marker='x', linewidth=3,
-                      alpha=0.5, label='Fauxflab Cluster')
-
-        # Draw prey
-        from agents import PreyAgent
-        prey_counts = {'hermi': 0, 'flab': 0, 'fauxflab': 0}
-        for agent in model.schedule.agents:
-            if isinstance(agent, PreyAgent):
-                x, y = agent.pos
-                color_map = {
-                    'hermi': 'cyan',
-                    'flab': 'pink',
-                    'fauxflab': 'yellow'
-                }
-                color = color_map.get(agent.prey_type, 'gray')
-                ax.scatter(x, y, c=color, s=100, edgecolors='black',
-                          linewidth=1, zorder=3, alpha=0.7)
-                prey_counts[agent.prey_type] += 1
-
-        # Draw slugs
-        for i, slug in enumerate(model.cyberslugs):
-            slug_x, slug_y = slug.pos
-
-            colors = ['brown', 'darkred', 'darkgreen', 'darkblue', 'purple', 'orange']
-            color = colors[i % len(colors)]
-
-            display_size = 400 + (slug.size * 40)
-
-            # Highlight based on state
-            if slug.is_biting:
-                edgecolor = 'red'
-                linewidth = 5
-            elif slug == model.being_observed:
-                edgecolor = 'gold'
-                linewidth = 4
-            else:
-                edgecolor = 'black'
-                linewidth = 2
-
-            # Draw slug body
-            ax.scatter(slug_x, slug_y, c=color, s=display_size, marker='o',
-                      edgecolors=edgecolor, linewidth=linewidth, zorder=5,
-                      alpha=0.8)
-
-            # Slug ID label
-            ax.text(slug_x, slug_y, str(i), fontsize=12, fontweight='bold',
-                   ha='center', va='center', color='white', zorder=6)
-
-            # Draw proboscis if extended
-            if slug.proboscis_extended:
-                prob_length = 0.15 * slug.size + 0.1 * slug.proboscis_phase
-                prob_x = slug_x + prob_length * math.cos(math.radians(slug.angle))
-                prob_y = slug_y + prob_length * math.sin(math.radians(slug.angle))
-                ax.plot([slug_x, prob_x], [slug_y, prob_y],
-                       color='red', linewidth=3, alpha=0.8, zorder=6)
-                ax.scatter(prob_x, prob_y, c='red', s=50, zorder=6)
-
-            # Draw heading indicator
-            heading_length = 20 + slug.size
-            end_x = slug_x + heading_length * math.cos(math.radians(slug.angle))
-            end_y = slug_y + heading_length * math.sin(math.radians(slug.angle))
-            ax.arrow(slug_x, slug_y, end_x - slug_x, end_y - slug_y,
-                    head_width=8, head_length=6, fc=color, ec=color,
-                    zorder=6, alpha=0.6)
-
-            # Show nociceptors if enabled
-            if show_nociceptors.value:
-                for noc in slug.nociceptors:
-                    # Color based on pain value
-                    if noc.painval > 0.000001:
-                        pain_intensity = min(1.0, noc.painval / 5.0)
-                        noc_color = (1.0, 1.0 - pain_intensity, 1.0 - pain_intensity)
-                        ax.scatter(noc.x, noc.y, c=[noc_color], s=80,
-                                  edgecolors='black', linewidth=1, zorder=7, alpha=0.8)
-
-            # Show bite indicator
-            if slug.is_biting and slug.bite_target:
-                tx, ty = slug.bite_target.pos
-                ax.plot([slug_x, tx], [slug_y, ty], 'r-', linewidth=4,
-                       alpha=0.7, zorder=4)
-                ax.text((slug_x + tx)/2, (slug_y + ty)/2, '💥',
-                       fontsize=24, ha='center', va='center', zorder=7)
-
-        # Legend
-        legend_elements = [
-            mpatches.Patch(color='cyan', label=f'Hermissenda ({prey_counts["hermi"]})'),
-            mpatches.Patch(color='pink', label=f'Flabellina ({prey_counts["flab"]})'),
-            mpatches.Patch(color='yellow', label=f'Faux-Flab ({prey_counts["fauxflab"]})'),
-        ]
-
-        if model.biting:
-            legend_elements.append(
-                mlines.Line2D([], [], color='red', linewidth=4,
-                             label='Biting!', marker='o', markersize=10)
-            )
-
-        ax.legend(handles=legend_elements, loc='upper right', fontsize=10)
-        ax.grid(True, alpha=0.2)
-        ax.set_xlabel('X Position')
-        ax.set_ylabel('Y Position')
+    def create_plot():
+        """Bring the main visualization up to date with the model"""
+        return scene.update(model, show_nociceptors.value)
 
-        return fig
+    # Redraw only when the model advanced or the overlay was toggled, not on
+    # every unrelated UI change (sliders, tool checkboxes, ...)
+    plot_dependencies = [scene, render_key, show_nociceptors.value]
+    fig = solara.use_memo(create_plot, dependencies=plot_dependencies)
 
     # Get selected slug
     selected_slug = (model.cyberslugs[selected_slug_idx.value]
@@ -382,8 +417,7 @@ def Page():
                     solara.Success(f"🔄 AUTO-RUNNING: {steps_per_frame.value} steps every {update_interval.value}s")
 
                 # Visualization
-                fig = create_plot()
-                solara.FigureMatplotlib(fig, dependencies=[render_key])
+                solara.FigureMatplotlib(fig, dependencies=plot_dependencies)
 
             # Right column - Controls and stats
             with solara.Column(style={"width": "35%", "padding": "10px"}):
@@ -393,17 +427,17 @@ def Page():
                 solara.Markdown("## 🛠️ Interactive Tools")
                 solara.Info("⚠️ Only one tool can be active at a time")
 
-                with solara.Row():
-                    solara.Checkbox(label="🖱️ Dragger (drag agents)", value=dragger_mode)
-                    solara.Checkbox(label="🔨 Poker (apply pain)", value=poker_mode)
-
-                solara.Checkbox(label="👁️ Set Observer (click slug)", value=observer_mode)
+                with solara.ToggleButtonsSingle(value=tool_mode):
+                    solara.Button("None", value='none')
+                    solara.Button("🖱️ Dragger (drag agents)", value='dragger')
+                    solara.Button("🔨 Poker (apply pain)", value='poker')
+                    solara.Button("👁️ Set Observer (click slug)", value='observer')
 
-                if dragger_mode.value:
+                if tool_mode.value == 'dragger':
                     solara.Warning("🖱️ Dragger active: Click and drag slugs or prey")
-                if poker_mode.value:
+                elif tool_mode.value == 'poker':
                     solara.Warning("🔨 Poker active: Click near slugs to apply pain")
-                if observer_mode.value:
+                elif tool_mode.value == 'observer':
                     solara.Warning("👁️ Observer mode: Click a slug to observe its variables")
 
                 solara.Markdown("---")
@@ -5,8 +5,9 @@ Run with: pytest test_cyberslug_complete.py -v
 """
 import pytest
 import numpy as np
+import model as model_module
 from model import CyberSlugModel
-from agents import CyberslugAgent, PreyAgent, Nociceptor
+from agents import CyberslugAgent, PreyAgent, Nociceptor, SlugPath
 
 
 class TestCyberSlugModel:
@@ -31,6 +32,18 @@ class TestCyberSlugModel:
         assert model.hermi_cluster_x is not None
         assert model.flab_cluster_x is not None
 
+    def test_cluster_centers_are_read_only(self):
+        """Test cluster_centers mirrors the cluster attributes without allowing writes"""
+        model = CyberSlugModel(clustering=True)
+        centers = model.cluster_centers
+
+        assert centers.tolist()[1] == [model.flab_cluster_x, model.flab_cluster_y]
+        with pytest.raises(ValueError):
+            centers[0, 0] = 1.0
+
+        model.hermi_cluster_x = 42.0
+        assert centers[0, 0] == 42.0
+
     def test_model_with_immobilize(self):
         """Test immobilize mode"""
         model = CyberSlugModel(immobilize=True)
@@ -102,6 +115,50 @@ class TestCyberSlugModel:
 
         assert model.ticks == steps
 
+    def test_step_without_odor_update(self):
+        """Test update_odor=False advances agents but leaves patches alone"""
+        model = CyberSlugModel()
+        model.step()
+        patches = model.patches.copy()
+
+        for _ in range(5):
+            model.step(update_odor=False)
+
+        assert model.ticks == 6
+        assert np.array_equal(model.patches, patches)
+
+    def test_reset_matches_fresh_model(self):
+        """Test that reset() replays the run a new model with that seed gives"""
+        fresh = CyberSlugModel(num_slugs=2, seed=3)
+        reused = CyberSlugModel(num_slugs=2, seed=7)
+        reused.step_many(20)
+        reused.reset(seed=3)
+
+        fresh.step_many(30)
+        reused.step_many(30)
+
+        assert reused.ticks == 30
+        assert len(reused.schedule.agents) == len(fresh.schedule.agents)
+        assert np.array_equal(reused.patches, fresh.patches)
+        assert reused.datacollector.get_model_vars_dataframe().equals(
+            fresh.datacollector.get_model_vars_dataframe())
+
+    def test_pyarrow_csv_reads_back_like_pandas(self, tmp_path):
+        """Test the pyarrow save_csv path reads back to the to_csv values"""
+        pytest.importorskip("pyarrow")
+        import pandas as pd
+        from run import save_csv
+
+        model = CyberSlugModel(seed=1)
+        model.step_many(10)
+        data = model.datacollector.get_model_vars_dataframe()
+        save_csv(data, str(tmp_path / "arrow.csv"))
+        data.to_csv(tmp_path / "pandas.csv")
+
+        pd.testing.assert_frame_equal(pd.read_csv(tmp_path / "arrow.csv", index_col=0),
+                                      pd.read_csv(tmp_path / "pandas.csv", index_col=0),
+                                      check_dtype=False, check_exact=True)
+
     def test_fix_satiation(self):
         """Test fixed satiation mode"""
         model = CyberSlugModel(fix_satiation_override=True, fix_satiation_value=0.8)
@@ -126,6 +183,43 @@ class TestCyberSlugModel:
         assert odors[0] > 0  # betaine
         assert odors[1] > 0  # hermi
 
+    def test_numpy_diffusion_matches_kernel(self, monkeypatch):
+        """Test the NumPy diffusion fallback against the Numba kernel"""
+        if model_module._diffuse is None:
+            pytest.skip("numba is not installed")
+        compiled = CyberSlugModel(seed=5)
+        fallback = CyberSlugModel(seed=5)
+        compiled.step_many(10)
+        fallback.step_many(10)
+        assert np.array_equal(compiled.patches, fallback.patches)
+
+        compiled.update_odor_patches()
+        monkeypatch.setattr(model_module, "_diffuse", None)
+        fallback.update_odor_patches()
+
+        assert np.allclose(fallback.patches, compiled.patches, rtol=1e-5, atol=1e-12)
+
+    def test_python_sensor_sums_match_kernel(self, monkeypatch):
+        """Test the Python sensor loop against the Numba sensor kernel"""
+        if model_module._sense_odors is None:
+            pytest.skip("numba is not installed")
+        model = CyberSlugModel(seed=5)
+        model.step_many(10)
+        angles = np.array([40.0, -40.0, 100.0, -100.0, 150.0, -150.0])
+        dists = np.array([0.4, 0.4, 0.3, 0.3, 0.35, 0.35])
+        weights = np.array([1.0, 1.0, 0.5, 0.5, 0.25, 0.25])
+        # Inside the grid, and at corners where sensors fall off and get clamped
+        probes = [(x, y, heading) for x, y in model.sample_positions(5) for heading in (0.0, 73.0)]
+        probes += [(0.5, 0.5, 225.0), (599.5, 599.5, 45.0)]
+
+        compiled = [model.get_sensor_odor_sums(x, y, h, 12.0, angles, dists, weights)
+                    for x, y, h in probes]
+        monkeypatch.setattr(model_module, "_sense_odors", None)
+        fallback = [model.get_sensor_odor_sums(x, y, h, 12.0, angles, dists, weights)
+                    for x, y, h in probes]
+
+        assert np.array_equal(np.array(fallback), np.array(compiled))
+
 
 class TestCyberslugAgent:
     """Test suite for CyberslugAgent with all features"""
@@ -190,6 +284,16 @@ class TestCyberslugAgent:
             assert isinstance(noc.x, (int, float))
             assert isinstance(noc.y, (int, float))
 
+    def test_nociceptor_points(self):
+        """Test the nociceptor array matches the individual nociceptors"""
+        model = CyberSlugModel()
+        slug = model.cyberslugs[0]
+        slug.update_nociceptor_positions()
+        model.apply_pain_at_position(*slug.pos)
+
+        expected = [[noc.x, noc.y, noc.painval] for noc in slug.nociceptors]
+        assert slug.nociceptor_points.tolist() == expected
+
     def test_proboscis_behavior(self):
         """Test proboscis extension behavior"""
         model = CyberSlugModel()
@@ -406,6 +510,39 @@ class TestPreyAgent:
 
         assert dist < model.cluster_radius + 10  # Small tolerance
 
+    @pytest.mark.parametrize("immobilize", [False, True])
+    def test_model_prey_step_matches_agent_step(self, immobilize):
+        """Test the model's batched prey step agrees with PreyAgent.step"""
+        model = CyberSlugModel(clustering=True, cluster_radius=15, immobilize=immobilize)
+        prey = model.prey_agents
+
+        # Deterministic branches only: manual heading, or seeking a cluster
+        # from outside its radius
+        for i, p in enumerate(prey):
+            model.space.move_agent(p, (100 + i, 100 + 2 * i))
+            if i % 2:
+                p.cluster_target = (500.0, 450.0)
+            else:
+                p.cluster_target = None
+                p.manual_heading = True
+                p.heading = 7.0 * i
+        start = [(p.pos, p.angle) for p in prey]
+
+        model._step_prey()
+        batched = [(p.pos, p.angle) for p in prey]
+
+        for p, (pos, angle) in zip(prey, start):
+            model.space.move_agent(p, pos)
+            p.angle = angle
+        for p in prey:
+            p.step()
+        scalar = [(p.pos, p.angle) for p in prey]
+
+        assert np.allclose([pos for pos, _ in batched], [pos for pos, _ in scalar], rtol=0, atol=1e-9)
+        assert np.allclose([a for _, a in batched], [a for _, a in scalar], rtol=0, atol=1e-9)
+        if immobilize:
+            assert [pos for pos, _ in batched] == [pos for pos, _ in start]
+
 
 class TestInteractions:
     """Test interactive features"""
@@ -481,5 +618,20 @@ class TestNociceptor:
         assert noc.hit == False
 
 
+class TestSlugPath:
+    """Test the slug path buffer"""
+
+    def test_keeps_latest_points_in_order(self):
+        """Test oldest points drop off once the path is full"""
+        path = SlugPath(maxlen=3)
+        assert path.points.shape == (0, 2)
+
+        for i in range(5):
+            path.append((i, -i))
+
+        assert len(path) == 3
+        assert path.points.tolist() == [[2, -2], [3, -3], [4, -4]]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
\ No newline at end of file